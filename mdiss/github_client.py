@@ -2,14 +2,28 @@
 GitHub API client for interacting with GitHub's REST API.
 """
 
+import copy
 import json
 import os
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Union
 
 import requests
 from requests.exceptions import RequestException
 
+try:  # optional speedup: C-accelerated JSON serialization
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # optional speedup: incremental JSON parsing for streamed issue lists
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
 from .models import AnalysisResult, FailedCommand
 
 
@@ -36,11 +50,72 @@ class GitHubIssue:
         }
 
 
+# Maximum number of characters of pretty-printed JSON shown in debug panels.
+# Large responses (e.g. list_issues with per_page=100) can easily reach hundreds
+# of kilobytes, and pygmentizing them costs >100 ms of CPU per call.
+DEBUG_JSON_LIMIT = 8192
+
+# Collapses runs of blank lines in a single pass; compiled once at import so
+# bulk runs do not pay the split/join/rescan cost per command body.
+_BLANK_LINES = re.compile(r"\n[ \t]*(?=\n)")
+
+# Issue body template for bulk_create_issues, built once at import time so the
+# per-command cost is a single .format() call instead of rebuilding the
+# multi-section literal for every command.
+_BULK_ISSUE_BODY_TMPL = """## 📋 Command
+```bash
+{command}
+```
+
+## 🚨 Error Output
+```
+{error_output}
+```
+
+## 📝 Metadata
+- **Source:** {source}
+- **Exit Code:** {return_code}
+- **Execution Time:** {execution_time:.2f}s
+
+## 🏷️ Labels
+- `bug`
+- `automated`
+- `priority:{priority}`
+- `category:{category}`
+"""
+
+
+def _dumps_payload(data: Any) -> bytes:
+    """Serialize a request payload to compact JSON bytes once, up front.
+
+    Passing pre-serialized bytes as ``data=`` skips requests' internal
+    ``json.dumps`` round trip per call; orjson is used when installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _format_debug_json(data: Any) -> str:
+    """Format data as pretty-printed JSON, truncated to DEBUG_JSON_LIMIT chars."""
+    text = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+    if len(text) > DEBUG_JSON_LIMIT:
+        truncated = len(text) - DEBUG_JSON_LIMIT
+        text = text[:DEBUG_JSON_LIMIT] + f"\n... ({truncated} bytes truncated)"
+    return text
+
+
 class GitHubClient:
     """Client for interacting with the GitHub API."""
 
     BASE_URL = "https://api.github.com"
 
+    # Number of concurrent worker threads used by bulk_create_issues.
+    BULK_MAX_WORKERS = 10
+
+    # Maximum number of (url, params) entries kept in the ETag cache.
+    ETAG_CACHE_SIZE = 1024
+
     def __init__(self, config=None, token: Optional[str] = None, **kwargs):
         """
         Initialize the GitHub client.
@@ -70,10 +145,50 @@ class GitHubClient:
             self._default_owner = None
             self._default_repo = None
 
+        # Precomputed '/repos/{owner}/{repo}' prefix for the default repo
+        self._repo_prefix = (
+            f"/repos/{self._default_owner}/{self._default_repo}"
+            if self._default_owner and self._default_repo
+            else None
+        )
+
         self.base_url = kwargs.get("base_url", self.BASE_URL)
         self.session = requests.Session()
         self._setup_session()
 
+        # ETag cache for conditional GETs: (url, params) -> (etag, body).
+        # A 304 reply has an empty body and is far cheaper rate-limit-wise,
+        # so repeated list_issues/get_issue calls avoid re-downloading bodies.
+        self._etag_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+        # Title-hash index filled by prime_issue_cache for O(1) duplicate checks
+        self._title_hashes: Optional[Dict[bytes, Dict[str, Any]]] = None
+
+        # Label names known to exist, per (owner, repo); lets ensure_labels
+        # skip the listing GET on repeat bulk invocations
+        self._known_labels: Dict[tuple, set] = {}
+
+    @cached_property
+    def _status_to_labels(self) -> Dict[str, tuple]:
+        """Status name -> tuple of labels, derived from status_mapping once."""
+        out = {}
+        for name, config in self.status_mapping.items():
+            labels = config.get("labels", ())
+            if isinstance(labels, list):
+                out[name] = tuple(labels)
+            elif labels:
+                out[name] = (labels,)
+            else:
+                out[name] = ()
+        return out
+
+    @cached_property
+    def _status_labels(self) -> frozenset:
+        """All status-related label names, derived from status_mapping once."""
+        return frozenset(
+            label for labels in self._status_to_labels.values() for label in labels
+        )
+
     def _get_owner_repo(
         self, owner: Optional[str] = None, repo: Optional[str] = None
     ) -> tuple:
@@ -86,6 +201,16 @@ class GitHubClient:
 
         return owner, repo
 
+    def _repo_endpoint(self, owner: str, repo: str) -> str:
+        """Return the '/repos/{owner}/{repo}' prefix, precomputed for defaults."""
+        if (
+            self._repo_prefix
+            and owner == self._default_owner
+            and repo == self._default_repo
+        ):
+            return self._repo_prefix
+        return f"/repos/{owner}/{repo}"
+
     @classmethod
     def setup_token(cls) -> str:
         """Interactively set up GitHub token.
@@ -120,6 +245,7 @@ class GitHubClient:
         self.token = config.token
         self._default_owner = config.owner
         self._default_repo = config.repo
+        self._repo_prefix = f"/repos/{config.owner}/{config.repo}"
         self._setup_session()
 
     def test_connection(self) -> bool:
@@ -190,7 +316,10 @@ class GitHubClient:
         return self._request("get", f"/repos/{self.config.owner}/{self.config.repo}")
 
     def _setup_session(self):
-        """Set up the requests session with headers and auth."""
+        """Set up the requests session with headers, auth, pooling and retries."""
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "mdiss/1.0.60",  # Updated to match test expectation
@@ -201,6 +330,25 @@ class GitHubClient:
 
         self.session.headers.update(headers)
 
+        # Normalized base URL computed once; _request only concatenates
+        self._base_prefix = self.base_url.rstrip("/") + "/"
+
+        # A larger pool keeps connections alive under concurrent bulk creation
+        # (default is 10 per host), and the retry policy absorbs transient
+        # 5xx/429 responses with exponential backoff.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST", "PATCH", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
         Make a request to the GitHub API.
@@ -222,7 +370,7 @@ class GitHubClient:
         from rich.panel import Panel
         from rich.syntax import Syntax
 
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        url = self._base_prefix + endpoint.lstrip("/")
         headers = kwargs.pop("headers", {})
         headers.update(self.session.headers)
 
@@ -230,6 +378,15 @@ class GitHubClient:
         if self.token and "Authorization" not in headers:
             headers["Authorization"] = f"token {self.token}"
 
+        # Conditional GET: send If-None-Match when we hold a cached ETag
+        cache_key = None
+        if method.lower() == "get":
+            params = kwargs.get("params")
+            cache_key = (url, tuple(sorted(params.items())) if params else ())
+            cached = self._etag_cache.get(cache_key)
+            if cached and cached[0] and "If-None-Match" not in headers:
+                headers["If-None-Match"] = cached[0]
+
         # Prepare request data for debug output
         debug_headers = headers.copy()
         if "Authorization" in debug_headers:
@@ -253,7 +410,7 @@ class GitHubClient:
         rprint(
             Panel(
                 Syntax(
-                    json.dumps(request_data, indent=2, ensure_ascii=False),
+                    _format_debug_json(request_data),
                     "json",
                     theme="monokai",
                 ),
@@ -266,14 +423,35 @@ class GitHubClient:
             response = self.session.request(
                 method=method, url=url, headers=headers, **kwargs
             )
+            # GitHub always answers UTF-8; skip charset autodetection
+            response.encoding = "utf-8"
+
+            # Serve 304 Not Modified straight from the ETag cache
+            if cache_key is not None and response.status_code == 304:
+                etag, body = self._etag_cache[cache_key]
+                self._etag_cache.move_to_end(cache_key)
+                rprint(
+                    Panel(
+                        f"304 Not Modified - served from ETag cache ({url})",
+                        title="[bold blue]Response: 304 Not Modified",
+                        border_style="blue",
+                    )
+                )
+                # Deep copy so callers cannot mutate the cached body
+                return copy.deepcopy(body)
 
             # Print response debug info
             try:
-                response_data = response.json()
+                # orjson parses the raw bytes directly, skipping the
+                # content -> str decode round trip of response.json()
+                if orjson is not None:
+                    response_data = orjson.loads(response.content)
+                else:
+                    response_data = response.json()
                 rprint(
                     Panel(
                         Syntax(
-                            json.dumps(response_data, indent=2, ensure_ascii=False),
+                            _format_debug_json(response_data),
                             "json",
                             theme="monokai",
                         ),
@@ -291,16 +469,36 @@ class GitHubClient:
                 )
 
             response.raise_for_status()
+
+            # Remember the ETag so the next GET can be conditional
+            if cache_key is not None and response.content:
+                etag = response.headers.get("ETag")
+                if etag:
+                    # Store a copy: the parsed body is returned to the
+                    # caller, who is free to mutate it
+                    self._etag_cache[cache_key] = (etag, copy.deepcopy(response_data))
+                    self._etag_cache.move_to_end(cache_key)
+                    while len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+
             return response_data if response.content else {}
 
         except requests.exceptions.RequestException as e:
             error_msg = f"GitHub API request failed: {str(e)}"
-            if hasattr(e, "response") and e.response is not None:
-                error_msg += f"\nStatus Code: {e.response.status_code}"
-                try:
-                    error_msg += f"\nResponse: {e.response.text}"
-                except:
-                    pass
+            resp = getattr(e, "response", None)
+            if resp is not None:
+                error_msg += f"\nStatus Code: {resp.status_code}"
+                # Reuse the already-parsed body when we have it; otherwise a
+                # truncated text slice avoids a second JSON parse in the error path
+                if "json" in resp.headers.get("Content-Type", ""):
+                    try:
+                        message = resp.json().get("message", resp.reason)
+                    except (ValueError, AttributeError):
+                        message = resp.text[:500]
+                else:
+                    message = resp.text[:500]
+                if message:
+                    error_msg += f"\nResponse: {message}"
 
             # Print error in red panel
             rprint(
@@ -336,8 +534,19 @@ class GitHubClient:
             else:
                 issue_data = issue
 
-        endpoint = f"/repos/{owner}/{repo}/issues"
-        return self._request("post", endpoint, json=issue_data)
+        endpoint = f"{self._repo_endpoint(owner, repo)}/issues"
+        created = self._request(
+            "post",
+            endpoint,
+            data=_dumps_payload(issue_data),
+            headers={"Content-Type": "application/json"},
+        )
+
+        # Keep the primed duplicate-check cache in sync with new issues
+        if self._title_hashes is not None and created.get("title"):
+            self._title_hashes[self._title_hash(created["title"])] = created
+
+        return created
 
     def create_issue_from_failed_command(
         self,
@@ -451,9 +660,8 @@ class GitHubClient:
         if suggested_solution.strip():
             body_parts.extend(["\n## Suggested Solution", suggested_solution.strip()])
 
-        # Join all parts and clean up
-        body = "\n".join(part for part in body_parts if part.strip())
-        body = "\n".join(line for line in body.split("\n") if line.strip() != "")
+        # Join all parts and drop blank lines in a single pass
+        body = _BLANK_LINES.sub("", "\n".join(body_parts)).strip()
 
         # Debug: Show the final body before sending
         rprint(
@@ -554,14 +762,67 @@ class GitHubClient:
             Issue data
         """
         owner, repo = self._get_owner_repo(owner, repo)
-        endpoint = f"/repos/{owner}/repo/issues/{issue_number}"
+        endpoint = f"{self._repo_endpoint(owner, repo)}/issues/{issue_number}"
         return self._request("get", endpoint)
 
+    def iter_issues(
+        self,
+        state: str = "open",
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        per_page: int = 100,
+        **params,
+    ):
+        """
+        Iterate over all repository issues, following pagination lazily.
+
+        Follows the RFC 5988 ``Link: <...>; rel="next"`` header so a full scan
+        costs one request per 100 issues instead of one per 30, and issues are
+        yielded page by page without materializing the whole list.
+
+        Args:
+            state: Issue state (open, closed, all)
+            owner: Repository owner (optional if set in config)
+            repo: Repository name (optional if set in config)
+            per_page: Page size (max 100)
+            **params: Additional query parameters
+
+        Yields:
+            Issue dictionaries
+        """
+        owner, repo = self._get_owner_repo(owner, repo)
+        params["state"] = state
+        params["per_page"] = per_page
+        url = f"{self.base_url.rstrip('/')}/repos/{owner}/{repo}/issues"
+
+        while url:
+            try:
+                response = self.session.get(url, params=params, stream=ijson is not None)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise RequestException(f"GitHub API request failed: {str(e)}") from e
+
+            if ijson is not None:
+                # Incremental parse straight off the socket: memory stays O(1)
+                # in page size and the connection is released sooner
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "item")
+            elif orjson is not None:
+                yield from orjson.loads(response.content)
+            else:
+                yield from response.json()
+
+            # The "next" link already embeds the query string
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else None
+            params = None
+
     def list_issues(
         self,
         state: str = "open",
         owner: Optional[str] = None,
         repo: Optional[str] = None,
+        paginate: bool = True,
         **params,
     ) -> List[Dict[str, Any]]:
         """
@@ -571,14 +832,18 @@ class GitHubClient:
             state: Issue state (open, closed, all)
             owner: Repository owner (optional if set in config)
             repo: Repository name (optional if set in config)
+            paginate: If True, follow Link headers and return all pages
             **params: Additional query parameters
 
         Returns:
             List of issues
         """
+        if paginate:
+            return list(self.iter_issues(state=state, owner=owner, repo=repo, **params))
+
         owner, repo = self._get_owner_repo(owner, repo)
         params["state"] = state
-        endpoint = f"/repos/{owner}/{repo}/issues"
+        endpoint = f"{self._repo_endpoint(owner, repo)}/issues"
         return self._request("get", endpoint, params=params)
 
     def update_issue(
@@ -601,7 +866,7 @@ class GitHubClient:
             Updated issue data
         """
         owner, repo = self._get_owner_repo(owner, repo)
-        endpoint = f"/repos/{owner}/{repo}/issues/{issue_number}"
+        endpoint = f"{self._repo_endpoint(owner, repo)}/issues/{issue_number}"
         return self._request("patch", endpoint, json=updates)
 
     def close_issue(
@@ -620,21 +885,127 @@ class GitHubClient:
         """
         return self.update_issue(issue_number, owner=owner, repo=repo, state="closed")
 
+    def ensure_labels(
+        self,
+        labels: List[str],
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+    ) -> None:
+        """
+        Make sure the given labels exist in the repository.
+
+        Pre-creating shared labels once keeps GitHub's inline label resolution
+        out of every issue-creation request in a bulk run. Results are cached
+        per (owner, repo) so repeat invocations skip the listing GET.
+
+        Args:
+            labels: Label names that should exist
+            owner: Repository owner (optional if set in config)
+            repo: Repository name (optional if set in config)
+        """
+        owner, repo = self._get_owner_repo(owner, repo)
+        cache_key = (owner, repo)
+
+        known = self._known_labels.get(cache_key)
+        if known is None:
+            try:
+                existing = self._request(
+                    "get",
+                    f"{self._repo_endpoint(owner, repo)}/labels",
+                    params={"per_page": 100},
+                )
+                known = {label["name"] for label in existing}
+            except RequestException:
+                # Listing failed (permissions, network); fall back to inline
+                # label resolution on issue creation
+                return
+            self._known_labels[cache_key] = known
+
+        for name in labels:
+            if name in known:
+                continue
+            try:
+                self._request(
+                    "post",
+                    f"{self._repo_endpoint(owner, repo)}/labels",
+                    json={"name": name},
+                )
+            except RequestException:
+                # Race with another writer or missing permission; creation
+                # with inline labels still works either way
+                pass
+            known.add(name)
+
+    def add_labels(
+        self,
+        issue_number: int,
+        labels: List[str],
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Add labels to an issue without fetching its current labels.
+
+        Args:
+            issue_number: Issue number
+            labels: Label names to add
+            owner: Repository owner (optional if set in config)
+            repo: Repository name (optional if set in config)
+
+        Returns:
+            The issue's label list after the addition
+        """
+        owner, repo = self._get_owner_repo(owner, repo)
+        endpoint = f"{self._repo_endpoint(owner, repo)}/issues/{issue_number}/labels"
+        return self._request("post", endpoint, json={"labels": labels})
+
+    def remove_label(
+        self,
+        issue_number: int,
+        label: str,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+    ) -> None:
+        """
+        Remove a single label from an issue, ignoring it if not present.
+
+        Args:
+            issue_number: Issue number
+            label: Label name to remove
+            owner: Repository owner (optional if set in config)
+            repo: Repository name (optional if set in config)
+        """
+        owner, repo = self._get_owner_repo(owner, repo)
+        endpoint = f"{self._repo_endpoint(owner, repo)}/issues/{issue_number}/labels/{label}"
+        try:
+            self._request("delete", endpoint)
+        except RequestException:
+            # GitHub answers 404 when the label is not on the issue
+            pass
+
     def update_issue_status(
         self,
         issue_number: int,
         status: str,
         owner: Optional[str] = None,
         repo: Optional[str] = None,
+        known_labels: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Update the status of an issue with a user-friendly status name.
 
+        When the caller already knows the issue's labels (e.g. right after
+        creating it), pass them via ``known_labels`` to collapse the whole
+        transition into a single PATCH. Otherwise the label delta is applied
+        server-side through the dedicated label endpoints, so no preliminary
+        GET of the issue is needed either way.
+
         Args:
             issue_number: The issue number to update
             status: The new status (open, closed, in_progress, reopened, done)
             owner: Repository owner (optional if set in config)
             repo: Repository name (optional if set in config)
+            known_labels: Current labels of the issue, if already known
 
         Returns:
             Updated issue data
@@ -654,46 +1025,91 @@ class GitHubClient:
         status_config = self.status_mapping[status]
         update_data = {}
 
-        # Get current issue to preserve existing labels
-        current_issue = self.get_issue(issue_number, owner=owner, repo=repo)
-        if not current_issue:
-            raise RequestException(f"Issue #{issue_number} not found")
-
         # Handle state update
         if "state" in status_config:
             update_data["state"] = status_config["state"]
 
         # Handle labels
-        if "labels" in status_config:
-            current_labels = {
-                label["name"] for label in current_issue.get("labels", [])
-            }
+        wanted = self._status_to_labels[status]
+        if wanted:
+            if known_labels is not None:
+                # Single PATCH: replace labels using the caller-provided set
+                new_labels = [
+                    label for label in known_labels if label not in self._status_labels
+                ]
+                new_labels.extend(wanted)
+                update_data["labels"] = new_labels
+            else:
+                # Server-side diff: the add response carries the issue's
+                # full post-add label list, so only status labels actually
+                # present (usually none) need a removal round trip
+                try:
+                    after_add = self.add_labels(
+                        issue_number, wanted, owner=owner, repo=repo
+                    )
+                except RequestException as e:
+                    if "404" in str(e):
+                        raise RequestException(
+                            f"Issue #{issue_number} not found"
+                        ) from e
+                    raise
+                current = {label.get("name", "") for label in after_add}
+                for label in current & self._status_labels:
+                    if label not in wanted:
+                        self.remove_label(issue_number, label, owner=owner, repo=repo)
+
+        # Update the issue with the new state (and labels when known)
+        return self.update_issue(issue_number, owner=owner, repo=repo, **update_data)
 
-            # Remove any existing status-related labels
-            status_labels = set()
-            for config in self.status_mapping.values():
-                if "labels" in config:
-                    if isinstance(config["labels"], list):
-                        status_labels.update(config["labels"])
-                    else:
-                        status_labels.add(config["labels"])
-
-            # Keep only non-status labels
-            new_labels = [
-                label for label in current_labels if label not in status_labels
-            ]
+    @staticmethod
+    def _title_hash(title: str) -> bytes:
+        """Hash a normalized issue title into a compact 64-bit digest."""
+        import hashlib
 
-            # Add new status labels if any
-            if "labels" in status_config:
-                if isinstance(status_config["labels"], list):
-                    new_labels.extend(status_config["labels"])
-                else:
-                    new_labels.append(status_config["labels"])
+        normalized = " ".join(title.lower().split())
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
 
-            update_data["labels"] = new_labels
+    def prime_issue_cache(
+        self,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        state: str = "open",
+    ) -> int:
+        """
+        Prefetch all issue titles once so existence checks become in-memory.
 
-        # Update the issue with the new state and labels
-        return self.update_issue(issue_number, owner=owner, repo=repo, **update_data)
+        Call before a bulk run that checks for duplicates: a single paginated
+        listing replaces the per-command list/search round trip, turning each
+        check_existing_issue call into an O(1) hash lookup.
+
+        Args:
+            owner: Repository owner (optional if set in config)
+            repo: Repository name (optional if set in config)
+            state: Issue state to prefetch (open, closed, all)
+
+        Returns:
+            Number of issues cached
+        """
+        issues = self.list_issues(state=state, owner=owner, repo=repo)
+        self._title_hashes = {
+            self._title_hash(issue.get("title", "")): issue for issue in issues
+        }
+        return len(self._title_hashes)
+
+    def search_issues(self, query: str, per_page: int = 10) -> Dict[str, Any]:
+        """
+        Search issues via the GitHub Search API.
+
+        Args:
+            query: Search query (GitHub search syntax)
+            per_page: Maximum number of results per page
+
+        Returns:
+            Search response with 'total_count' and 'items'
+        """
+        return self._request(
+            "get", "/search/issues", params={"q": query, "per_page": per_page}
+        )
 
     def check_existing_issue(
         self,
@@ -705,6 +1121,11 @@ class GitHubClient:
         """
         Check if an issue for the given command already exists.
 
+        Uses the Search API so the title match runs on GitHub's index and only
+        matching issues are transferred, instead of listing and scanning whole
+        pages of issues client-side. Falls back to list-and-scan if the search
+        request fails (e.g. search quota exhausted).
+
         Args:
             command: The failed command to check
             owner: Repository owner (optional if set in config)
@@ -714,11 +1135,26 @@ class GitHubClient:
         Returns:
             The existing issue if found, None otherwise
         """
-        # Search for issues with a similar title
-        issues = self.list_issues(owner=owner, repo=repo, **kwargs)
-
-        # Look for an issue with a matching title
         search_phrase = f"Fix failed command: {command.title}"
+
+        # Primed cache: O(1) in-memory lookup, zero network
+        if self._title_hashes is not None:
+            return self._title_hashes.get(self._title_hash(search_phrase))
+
+        try:
+            search_owner, search_repo = self._get_owner_repo(owner, repo)
+            escaped = search_phrase.replace('"', "")
+            query = f'repo:{search_owner}/{search_repo} in:title "{escaped}"'
+            result = self.search_issues(query)
+            items = result.get("items", [])
+            if items:
+                return items[0]
+            return None
+        except RequestException:
+            pass
+
+        # Fallback: list issues and scan titles client-side
+        issues = self.list_issues(owner=owner, repo=repo, **kwargs)
         for issue in issues:
             if search_phrase.lower() in issue.get("title", "").lower():
                 return issue
@@ -745,8 +1181,14 @@ class GitHubClient:
 
         Returns:
             List of created issues or issue data if dry_run
+
+        Notes:
+            Issue creation POSTs are dispatched concurrently (up to
+            BULK_MAX_WORKERS threads) so wall time no longer scales with
+            N times the network round trip. Results keep the input order.
         """
         import json
+        from concurrent.futures import ThreadPoolExecutor
 
         from rich import print as rprint
         from rich.panel import Panel
@@ -758,38 +1200,30 @@ class GitHubClient:
         owner, repo = self._get_owner_repo(owner, repo)
         created_issues = []
 
+        # Build all payloads up front so the network phase is pure I/O
+        payloads = []
         for cmd in commands:
             analysis = analyzer.analyze(cmd)
 
             # Create the issue data that would be sent to GitHub
+            priority = analysis.priority.value.lower()
+            category = analysis.category.value.lower()
             issue_data = {
                 "title": f"Fix: {cmd.title}",
-                "body": f"""## 📋 Command
-```bash
-{cmd.command}
-```
-
-## 🚨 Error Output
-```
-{cmd.error_output}
-```
-
-## 📝 Metadata
-- **Source:** {cmd.source}
-- **Exit Code:** {getattr(cmd, 'return_code', 'N/A')}
-- **Execution Time:** {getattr(cmd, 'execution_time', 0):.2f}s
-
-## 🏷️ Labels
-- `bug`
-- `automated`
-- `priority:{analysis.priority.value.lower()}`
-- `category:{analysis.category.value.lower()}`
-""",
+                "body": _BULK_ISSUE_BODY_TMPL.format(
+                    command=cmd.command,
+                    error_output=cmd.error_output,
+                    source=cmd.source,
+                    return_code=getattr(cmd, "return_code", "N/A"),
+                    execution_time=getattr(cmd, "execution_time", 0),
+                    priority=priority,
+                    category=category,
+                ),
                 "labels": [
                     "bug",
                     "automated",
-                    f"priority:{analysis.priority.value.lower()}",
-                    f"category:{analysis.category.value.lower()}",
+                    f"priority:{priority}",
+                    f"category:{category}",
                 ],
             }
 
@@ -800,20 +1234,21 @@ class GitHubClient:
                 else:
                     issue_data["labels"].extend(kwargs.get("labels", []))
 
-            # Prepare the complete request that would be sent
-            request_info = {
-                "method": "POST",
-                "url": f"{self.base_url}/repos/{owner}/{repo}/issues",
-                "headers": {
-                    "Authorization": f"token {self.token[:8]}...",
-                    "Accept": "application/vnd.github.v3+json",
-                    "Content-Type": "application/json",
-                },
-                "json": issue_data,
-            }
+            payloads.append((cmd, issue_data))
 
-            if dry_run:
+        if dry_run:
+            for cmd, issue_data in payloads:
                 # Show the complete request that would be sent
+                request_info = {
+                    "method": "POST",
+                    "url": f"{self.base_url}/repos/{owner}/{repo}/issues",
+                    "headers": {
+                        "Authorization": f"token {self.token[:8]}...",
+                        "Accept": "application/vnd.github.v3+json",
+                        "Content-Type": "application/json",
+                    },
+                    "json": issue_data,
+                }
                 rprint(
                     Panel(
                         Syntax(
@@ -826,12 +1261,27 @@ class GitHubClient:
                     )
                 )
                 created_issues.append(issue_data)
-            else:
+            return created_issues
+
+        # Pre-create the union of labels once so each creation POST skips
+        # GitHub's inline label resolution
+        all_labels = {label for _, data in payloads for label in data["labels"]}
+        if all_labels:
+            self.ensure_labels(sorted(all_labels), owner=owner, repo=repo)
+
+        # Dispatch the POSTs concurrently; requests.Session is thread-safe and
+        # its urllib3 pool reuses TLS sockets across the worker threads.
+        max_workers = min(self.BULK_MAX_WORKERS, len(payloads)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.create_issue, owner=owner, repo=repo, issue=issue_data, **kwargs
+                )
+                for _, issue_data in payloads
+            ]
+            for (cmd, _), future in zip(payloads, futures):
                 try:
-                    issue = self.create_issue(
-                        owner=owner, repo=repo, issue=issue_data, **kwargs
-                    )
-                    created_issues.append(issue)
+                    created_issues.append(future.result())
                 except Exception as e:
                     print(f"Failed to create issue for command '{cmd.command}': {e}")
 
@@ -0,0 +1,260 @@
+"""
+Asynchronous GitHub API client built on httpx.AsyncClient.
+
+Mirrors the public API of :class:`mdiss.github_client.GitHubClient` so callers
+can overlap independent operations (bulk create + list + update) with
+``asyncio.gather``. HTTP/2 multiplexes all requests over a single TLS
+connection, avoiding per-request handshake cost.
+
+Requires the optional ``httpx`` dependency (install the ``async`` extra).
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from .github_client import GitHubIssue, _dumps_payload
+from .models import FailedCommand
+
+
+class AsyncGitHubClient:
+    """Async client for interacting with the GitHub API."""
+
+    BASE_URL = "https://api.github.com"
+
+    # Connection limits mirroring GitHubClient's pooled HTTPAdapter
+    MAX_CONNECTIONS = 32
+
+    def __init__(self, config=None, token: Optional[str] = None, **kwargs):
+        """
+        Initialize the async GitHub client.
+
+        Args:
+            config: Optional GitHubConfig object with token, owner, and repo
+            token: GitHub personal access token (alternative to config)
+            **kwargs: Additional arguments like base_url for GitHub Enterprise
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncGitHubClient. "
+                "Install it with: pip install httpx[http2]"
+            )
+
+        self.config = config
+
+        if config:
+            self.token = config.token
+            self._default_owner = config.owner
+            self._default_repo = config.repo
+        else:
+            self.token = token or os.getenv("GITHUB_TOKEN")
+            self._default_owner = None
+            self._default_repo = None
+
+        self.base_url = kwargs.get("base_url", self.BASE_URL)
+
+        headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "mdiss/1.0.60",
+        }
+        if self.token:
+            headers["Authorization"] = f"token {self.token}"
+
+        try:
+            limits = httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_CONNECTIONS,
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url, http2=True, headers=headers, limits=limits
+            )
+        except ImportError:
+            # http2 extra (h2) not installed; plain HTTP/1.1 keep-alive
+            self._client = httpx.AsyncClient(base_url=self.base_url, headers=headers)
+
+    def _get_owner_repo(
+        self, owner: Optional[str] = None, repo: Optional[str] = None
+    ) -> tuple:
+        """Get owner and repo, falling back to config if not provided."""
+        owner = owner or self._default_owner
+        repo = repo or self._default_repo
+
+        if not owner or not repo:
+            raise ValueError("Owner and repo must be provided or set in config")
+
+        return owner, repo
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make an async request to the GitHub API.
+
+        Args:
+            method: HTTP method (get, post, patch, etc.)
+            endpoint: API endpoint (e.g., '/repos/owner/repo/issues')
+            **kwargs: Additional arguments for httpx.AsyncClient.request()
+
+        Returns:
+            JSON response as a dictionary
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        response = await self._client.request(method, endpoint, **kwargs)
+        response.raise_for_status()
+        return response.json() if response.content else {}
+
+    async def create_issue(
+        self,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        issue: Optional[Union[GitHubIssue, Dict[str, Any]]] = None,
+        **issue_data,
+    ) -> Dict[str, Any]:
+        """Create a new GitHub issue."""
+        owner, repo = self._get_owner_repo(owner, repo)
+
+        if issue is not None:
+            if isinstance(issue, GitHubIssue):
+                issue_data = issue.to_dict()
+            else:
+                issue_data = issue
+
+        endpoint = f"/repos/{owner}/{repo}/issues"
+        return await self._request(
+            "POST",
+            endpoint,
+            content=_dumps_payload(issue_data),
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def get_issue(
+        self, issue_number: int, owner: Optional[str] = None, repo: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get a single issue."""
+        owner, repo = self._get_owner_repo(owner, repo)
+        endpoint = f"/repos/{owner}/{repo}/issues/{issue_number}"
+        return await self._request("GET", endpoint)
+
+    async def list_issues(
+        self,
+        state: str = "open",
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        per_page: int = 100,
+        **params,
+    ) -> List[Dict[str, Any]]:
+        """List repository issues, following pagination."""
+        owner, repo = self._get_owner_repo(owner, repo)
+        params["state"] = state
+        params["per_page"] = per_page
+
+        issues: List[Dict[str, Any]] = []
+        url = f"/repos/{owner}/{repo}/issues"
+
+        while url:
+            response = await self._client.get(url, params=params)
+            response.raise_for_status()
+            issues.extend(response.json())
+
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else None
+            params = None
+
+        return issues
+
+    async def update_issue(
+        self,
+        issue_number: int,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        **updates,
+    ) -> Dict[str, Any]:
+        """Update an existing issue."""
+        owner, repo = self._get_owner_repo(owner, repo)
+        endpoint = f"/repos/{owner}/{repo}/issues/{issue_number}"
+        return await self._request("PATCH", endpoint, json=updates)
+
+    async def close_issue(
+        self, issue_number: int, owner: Optional[str] = None, repo: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Close an issue."""
+        return await self.update_issue(
+            issue_number, owner=owner, repo=repo, state="closed"
+        )
+
+    async def bulk_create_issues(
+        self,
+        commands: List["FailedCommand"],
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create GitHub issues for multiple failed commands concurrently.
+
+        All POSTs are dispatched with asyncio.gather and multiplexed over the
+        shared connection, so wall time is bounded by the slowest request
+        rather than the sum of round trips.
+        """
+        from .analyzer import ErrorAnalyzer
+
+        analyzer = ErrorAnalyzer()
+        owner, repo = self._get_owner_repo(owner, repo)
+
+        payloads = []
+        for cmd in commands:
+            analysis = analyzer.analyze(cmd)
+            payloads.append(
+                {
+                    "title": f"Fix: {cmd.title}",
+                    "body": (
+                        f"## Command\n```bash\n{cmd.command}\n```\n\n"
+                        f"## Error Output\n```\n{cmd.error_output}\n```\n\n"
+                        f"## Metadata\n"
+                        f"- **Source:** {cmd.source}\n"
+                        f"- **Exit Code:** {cmd.return_code}\n"
+                        f"- **Execution Time:** {cmd.execution_time:.2f}s\n"
+                    ),
+                    "labels": [
+                        "bug",
+                        "automated",
+                        f"priority:{analysis.priority.value.lower()}",
+                        f"category:{analysis.category.value.lower()}",
+                    ],
+                }
+            )
+
+        results = await asyncio.gather(
+            *[
+                self.create_issue(owner=owner, repo=repo, issue=payload, **kwargs)
+                for payload in payloads
+            ],
+            return_exceptions=True,
+        )
+
+        created_issues = []
+        for cmd, result in zip(commands, results):
+            if isinstance(result, Exception):
+                print(f"Failed to create issue for command '{cmd.command}': {result}")
+            else:
+                created_issues.append(result)
+
+        return created_issues
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
@@ -1,5 +1,6 @@
 """Integration modules for issue trackers and other services."""
-from typing import Any, Dict, Optional, Type
+from types import MappingProxyType
+from typing import Any, Mapping, Type
 
 # Import integrations
 from .github_integration import GitHubIntegration
@@ -12,6 +13,14 @@ __all__ = [
     "get_integration",
 ]
 
+# Built once at import time; read-only so per-call dict construction is gone
+_PROVIDERS: Mapping[str, Type] = MappingProxyType(
+    {
+        "github": GitHubIntegration,
+        "gitlab": GitLabIntegration,
+    }
+)
+
 
 def get_integration(provider: str, **kwargs) -> Any:
     """Get an integration instance by provider name.
@@ -26,15 +35,11 @@ def get_integration(provider: str, **kwargs) -> Any:
     Raises:
         ValueError: If the provider is not supported
     """
-    providers: Dict[str, Type] = {
-        "github": GitHubIntegration,
-        "gitlab": GitLabIntegration,
-    }
-
-    provider = provider.lower()
-    if provider not in providers:
+    # The or-chain skips str.lower() in the common lowercase case
+    cls = _PROVIDERS.get(provider) or _PROVIDERS.get(provider.lower())
+    if cls is None:
         raise ValueError(
-            f"Unsupported provider: {provider}. Available providers: {', '.join(providers.keys())}"
+            f"Unsupported provider: {provider}. Available providers: {', '.join(_PROVIDERS)}"
         )
 
-    return providers[provider](**kwargs)
+    return cls(**kwargs)
@@ -0,0 +1,136 @@
+"""Shared HTTP session for integration clients.
+
+Each integration instance otherwise carries its own connection pool, so
+per-repo workers that instantiate clients repeatedly pay a fresh TLS
+handshake per instance. Sharing one pooled session keeps sockets alive
+across instances and absorbs transient failures with retry/backoff.
+
+The shared adapter is also rate-limit aware: it reads the remaining/reset
+headers that GitHub and GitLab return on every response and paces requests
+so the quota drains evenly instead of bursting into 429s and retrying.
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    respect_retry_after_header=True,
+)
+
+# Header pairs (remaining, reset) used by GitHub and GitLab respectively
+_RATE_HEADERS = (
+    ("X-RateLimit-Remaining", "X-RateLimit-Reset"),
+    ("RateLimit-Remaining", "RateLimit-Reset"),
+)
+
+
+class RateLimiter:
+    """Token bucket paced by server-reported rate-limit headers.
+
+    ``acquire()`` blocks until a token is available; ``update()`` refills
+    the bucket from the remaining/reset headers of each response, so the
+    send rate converges on ``remaining / (reset - now)`` requests per
+    second and the client never races the quota.
+    """
+
+    def __init__(self, burst: int = 10):
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        # tokens/second; None means "no server data yet", 0.0 means the
+        # quota is exhausted until _reset_at
+        self._rate = None
+        self._reset_at = 0.0  # wall-clock time the quota window reopens
+        self._last_refill = time.monotonic()
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        with self._cond:
+            while True:
+                self._refill_locked()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                if self._rate:
+                    wait = (1.0 - self._tokens) / self._rate
+                elif self._rate is None:
+                    wait = 0.1
+                else:
+                    # Quota exhausted: sleep out the reported reset window
+                    wait = max(self._reset_at - time.time(), 0.1)
+                self._cond.wait(timeout=wait)
+
+    def update(self, response: requests.Response) -> None:
+        """Re-derive the refill rate from a response's rate-limit headers."""
+        for remaining_header, reset_header in _RATE_HEADERS:
+            remaining = response.headers.get(remaining_header)
+            reset = response.headers.get(reset_header)
+            if remaining is None or reset is None:
+                continue
+            try:
+                remaining_n = int(remaining)
+                reset_at = int(reset)
+            except ValueError:
+                return
+            window = max(reset_at - time.time(), 1.0)
+            with self._cond:
+                if remaining_n <= 0:
+                    # Nothing left in this window: drain the bucket and
+                    # hold every sender until the server-reported reset
+                    self._rate = 0.0
+                    self._tokens = 0.0
+                    self._reset_at = reset_at
+                else:
+                    self._rate = remaining_n / window
+                self._cond.notify_all()
+            return
+
+    def _refill_locked(self) -> None:
+        now = time.monotonic()
+        if self._rate is None:
+            # No server data yet: stay at burst capacity
+            self._tokens = self._burst
+        elif self._rate > 0:
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._last_refill) * self._rate
+            )
+        elif time.time() >= self._reset_at:
+            # The window reopened; refill and wait for fresh headers
+            self._rate = None
+            self._tokens = self._burst
+        self._last_refill = now
+
+
+class RateLimitAdapter(HTTPAdapter):
+    """HTTPAdapter that paces sends through a shared RateLimiter."""
+
+    def __init__(self, rate_limiter: RateLimiter, **kwargs):
+        self._rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self._rate_limiter.acquire()
+        response = super().send(request, **kwargs)
+        self._rate_limiter.update(response)
+        return response
+
+
+RATE_LIMITER = RateLimiter()
+
+SHARED_SESSION = requests.Session()
+
+_adapter = RateLimitAdapter(
+    RATE_LIMITER,
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=RETRY_POLICY,
+)
+SHARED_SESSION.mount("https://", _adapter)
+SHARED_SESSION.mount("http://", _adapter)
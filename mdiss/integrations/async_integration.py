@@ -0,0 +1,275 @@
+"""Async issue-tracker integrations built on httpx.AsyncClient.
+
+Unlike the PyGithub/python-gitlab based integrations, which walk paginated
+listings one blocking round trip at a time, these variants fetch the first
+page, derive the page count from the ``Link`` header, and fan out the
+remaining pages concurrently under a semaphore that respects API rate limits.
+
+Requires the optional ``httpx`` dependency (install the ``async`` extra).
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from dotenv import load_dotenv
+
+# Maximum number of page requests in flight at once
+MAX_CONCURRENT_REQUESTS = 10
+
+
+def _make_client(base_url: str, headers: Dict[str, str]) -> "httpx.AsyncClient":
+    """Create an AsyncClient with pooled connections, HTTP/2 when possible."""
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    try:
+        return httpx.AsyncClient(
+            base_url=base_url, http2=True, headers=headers, limits=limits
+        )
+    except ImportError:
+        # h2 extra not installed; HTTP/1.1 keep-alive still pools connections
+        return httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits)
+
+
+def _last_page(response: "httpx.Response") -> int:
+    """Extract the last page number from an RFC 5988 Link header."""
+    last_link = response.links.get("last")
+    if not last_link:
+        return 1
+    params = httpx.URL(last_link["url"]).params
+    try:
+        return int(params.get("page", 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+class AsyncGitHubIntegration:
+    """Async GitHub API access for issue management."""
+
+    BASE_URL = "https://api.github.com"
+
+    def __init__(self, token: Optional[str] = None):
+        """Initialize async GitHub integration.
+
+        Args:
+            token: GitHub personal access token
+
+        Raises:
+            ImportError: If httpx is not installed
+            ValueError: If no token is available
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncGitHubIntegration. "
+                "Install it with: pip install httpx[http2]"
+            )
+
+        load_dotenv()
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        if not self.token:
+            raise ValueError("GitHub token is required.")
+
+        self._client = _make_client(
+            self.BASE_URL,
+            {
+                "Authorization": f"token {self.token}",
+                "Accept": "application/vnd.github.v3+json",
+            },
+        )
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _get_page(self, url: str, params: Dict[str, Any]) -> "httpx.Response":
+        async with self._semaphore:
+            response = await self._client.get(url, params=params)
+            response.raise_for_status()
+            return response
+
+    async def alist_issues(
+        self, repo_name: str, state: str = "open", **filters: Any
+    ) -> List[Dict[str, Any]]:
+        """List issues in a repository, fetching pages concurrently.
+
+        Args:
+            repo_name: Repository name with owner (e.g., 'owner/repo')
+            state: Issue state ('open', 'closed', 'all')
+            **filters: Additional GitHub issue filters
+
+        Returns:
+            List of issues as returned by the REST API
+        """
+        url = f"/repos/{repo_name}/issues"
+        params = {"state": state, "per_page": 100, **filters}
+
+        first = await self._get_page(url, {**params, "page": 1})
+        issues: List[Dict[str, Any]] = list(first.json())
+
+        last = _last_page(first)
+        if last > 1:
+            responses = await asyncio.gather(
+                *[self._get_page(url, {**params, "page": p}) for p in range(2, last + 1)]
+            )
+            for response in responses:
+                issues.extend(response.json())
+
+        return issues
+
+    async def acreate_issue(
+        self,
+        repo_name: str,
+        title: str,
+        body: str,
+        labels: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a new GitHub issue.
+
+        Args:
+            repo_name: Repository name with owner
+            title: Issue title
+            body: Issue body (markdown supported)
+            labels: List of label names
+            **kwargs: Additional GitHub issue attributes
+
+        Returns:
+            Created issue data
+        """
+        async with self._semaphore:
+            response = await self._client.post(
+                f"/repos/{repo_name}/issues",
+                json={"title": title, "body": body, "labels": labels or [], **kwargs},
+            )
+            response.raise_for_status()
+            return response.json()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncGitHubIntegration":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+
+class AsyncGitLabIntegration:
+    """Async GitLab API access for issue management."""
+
+    def __init__(self, token: Optional[str] = None, url: Optional[str] = None):
+        """Initialize async GitLab integration.
+
+        Args:
+            token: GitLab private token with API access
+            url: GitLab instance URL (defaults to gitlab.com)
+
+        Raises:
+            ImportError: If httpx is not installed
+            ValueError: If no token is available
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for AsyncGitLabIntegration. "
+                "Install it with: pip install httpx[http2]"
+            )
+
+        load_dotenv()
+        self.token = token or os.getenv("GITLAB_TOKEN")
+        self.url = url or os.getenv("GITLAB_URL", "https://gitlab.com")
+        if not self.token:
+            raise ValueError(
+                "GitLab token is required. Set GITLAB_TOKEN environment variable."
+            )
+
+        self._client = _make_client(
+            f"{self.url.rstrip('/')}/api/v4", {"PRIVATE-TOKEN": self.token}
+        )
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _get_page(self, url: str, params: Dict[str, Any]) -> "httpx.Response":
+        async with self._semaphore:
+            response = await self._client.get(url, params=params)
+            response.raise_for_status()
+            return response
+
+    async def alist_issues(
+        self, project_id: str, state: str = "opened", **filters: Any
+    ) -> List[Dict[str, Any]]:
+        """List issues in a project, fetching pages concurrently.
+
+        Args:
+            project_id: Project ID or URL-encoded path with namespace
+            state: Issue state ('opened', 'closed', 'all')
+            **filters: Additional GitLab issue filters
+
+        Returns:
+            List of issues as returned by the REST API
+        """
+        url = f"/projects/{project_id}/issues"
+        params = {"state": state, "per_page": 100, **filters}
+
+        first = await self._get_page(url, {**params, "page": 1})
+        issues: List[Dict[str, Any]] = list(first.json())
+
+        try:
+            total_pages = int(first.headers.get("X-Total-Pages", 1))
+        except (TypeError, ValueError):
+            total_pages = 1
+
+        if total_pages > 1:
+            responses = await asyncio.gather(
+                *[
+                    self._get_page(url, {**params, "page": p})
+                    for p in range(2, total_pages + 1)
+                ]
+            )
+            for response in responses:
+                issues.extend(response.json())
+
+        return issues
+
+    async def acreate_issue(
+        self,
+        project_id: str,
+        title: str,
+        description: str,
+        labels: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a new issue in GitLab.
+
+        Args:
+            project_id: Project ID or URL-encoded path with namespace
+            title: Issue title
+            description: Issue description (markdown supported)
+            labels: List of labels to apply
+            **kwargs: Additional GitLab issue attributes
+
+        Returns:
+            Created issue data
+        """
+        async with self._semaphore:
+            response = await self._client.post(
+                f"/projects/{project_id}/issues",
+                json={
+                    "title": title,
+                    "description": description,
+                    "labels": ",".join(labels) if labels else "",
+                    **kwargs,
+                },
+            )
+            response.raise_for_status()
+            return response.json()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncGitLabIntegration":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
@@ -1,16 +1,53 @@
 """GitHub integration for issue management."""
+import copy
+import functools
+import itertools
+import json
 import os
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
+import requests
 from dotenv import load_dotenv
-from github import Github, GithubIntegration
-from github.Issue import Issue
-from github.Repository import Repository
+
+from ._http import RATE_LIMITER, RETRY_POLICY, SHARED_SESSION, RateLimitAdapter
+
+try:  # C decoder; optional, stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if TYPE_CHECKING:
+    from github import Github, GithubIntegration
+    from github.Issue import Issue
+    from github.Repository import Repository
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> None:
+    """Read .env a single time per process instead of per instance."""
+    load_dotenv()
+
+
+# Installation IDs change rarely; resolving one per client construction
+# would cost an HTTPS round trip for every worker that builds its own client
+_INSTALLATION_CACHE: Dict[tuple, int] = {}
+_INSTALLATION_LOCK = threading.Lock()
 
 
 class GitHubIntegration:
     """Handles GitHub API interactions for issue management."""
 
+    # How long (seconds) a cached list_issues result stays fresh
+    ISSUES_CACHE_TTL = 60.0
+
+    GRAPHQL_URL = "https://api.github.com/graphql"
+
+    # Aliased createIssue mutations per GraphQL request; stays well under
+    # GitHub's node limits while amortizing the round trip across issues
+    GRAPHQL_BULK_CHUNK = 50
+
     def __init__(
         self,
         token: Optional[str] = None,
@@ -26,31 +63,69 @@ class GitHubIntegration:
             private_key: GitHub App private key (for app authentication)
             org_name: Organization name (required for app authentication)
         """
-        load_dotenv()
+        _load_env_once()
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.app_id = app_id or os.getenv("GITHUB_APP_ID")
         self.private_key = private_key or os.getenv("GITHUB_PRIVATE_KEY")
         self.org_name = org_name or os.getenv("GITHUB_ORG")
         self.client = self._get_client()
 
-    def _get_client(self) -> Union[Github, GithubIntegration]:
+        # TTL caches: repeated calls for the same repo within one run skip the
+        # get_repo/list round trips (and their rate-limit tokens)
+        self._cache_lock = threading.Lock()
+        self._repo_cache: Dict[str, tuple] = {}
+        self._issues_cache: Dict[tuple, tuple] = {}
+        self._node_id_cache: Dict[str, str] = {}
+        self._graphql_session: Optional[requests.Session] = None
+
+    def _get_client(self) -> Union["Github", "GithubIntegration"]:
         """Initialize and return GitHub client."""
+        # Deferred: PyGithub (and its jwt/cryptography stack) only loads
+        # when a client is actually constructed, not on `import mdiss`
+        from github import Github, GithubIntegration
+
         if self.app_id and self.private_key and self.org_name:
             # App authentication
             integration = GithubIntegration(
                 integration_id=self.app_id, private_key=self.private_key
             )
-            installation_id = integration.get_installations()[0].id
+            key = (self.app_id, self.org_name)
+            with _INSTALLATION_LOCK:
+                installation_id = _INSTALLATION_CACHE.get(key)
+            if installation_id is None:
+                # Targeted lookup for the org installation; listing all
+                # installations and taking [0] is both slower and fragile
+                installation_id = integration.get_org_installation(
+                    self.org_name
+                ).id
+                with _INSTALLATION_LOCK:
+                    _INSTALLATION_CACHE[key] = installation_id
             return integration.get_github_for_installation(installation_id)
 
         if self.token:
-            # Token authentication
-            return Github(self.token)
+            # Token authentication with a sized pool and retry/backoff so
+            # bursty calls reuse connections instead of re-handshaking
+            return Github(
+                self.token, per_page=100, pool_size=32, retry=RETRY_POLICY
+            )
 
         raise ValueError(
             "Either GitHub token or App credentials (app_id, private_key, org_name) are required."
         )
 
+    def _get_repo_cached(self, repo_name: str, ttl: float = 300.0) -> "Repository":
+        """Resolve a Repository object, reusing it within the TTL window."""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._repo_cache.get(repo_name)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        repo = self.client.get_repo(repo_name)
+        with self._cache_lock:
+            self._repo_cache[repo_name] = (now + ttl, repo)
+        return repo
+
     def create_issue(
         self,
         repo_name: str,
@@ -71,8 +146,14 @@ class GitHubIntegration:
         Returns:
             Created issue data
         """
-        repo = self.client.get_repo(repo_name)
+        repo = self._get_repo_cached(repo_name)
         issue = repo.create_issue(title=title, body=body, labels=labels or [], **kwargs)
+
+        # New issue makes cached listings for this repo stale
+        with self._cache_lock:
+            for key in [k for k in self._issues_cache if k[0] == repo_name]:
+                del self._issues_cache[key]
+
         return self._issue_to_dict(issue)
 
     def update_issue(
@@ -88,47 +169,261 @@ class GitHubIntegration:
         Returns:
             Updated issue data
         """
-        repo = self.client.get_repo(repo_name)
+        repo = self._get_repo_cached(repo_name)
         issue = repo.get_issue(issue_number)
 
-        # Update fields if provided
-        for key, value in kwargs.items():
-            if hasattr(issue, key):
-                setattr(issue, f"_{key}", value)
-
-        issue = issue.edit(**kwargs)
+        # edit() PATCHes and refreshes the object in place; poking private
+        # attributes beforehand only risks triggering PyGithub's lazy refetch
+        issue.edit(**kwargs)
         return self._issue_to_dict(issue)
 
-    def list_issues(
+    def iter_issues(
+        self,
+        repo_name: str,
+        state: str = "open",
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over issues lazily; stop early without fetching all pages.
+
+        The client is configured with per_page=100 (the API maximum), so a
+        full scan costs a third of the round trips of PyGithub's default.
+
+        Args:
+            repo_name: Repository name with owner
+            state: Issue state ('open', 'closed', 'all')
+            limit: Maximum number of issues to yield
+            **filters: Additional GitHub issue filters
+
+        Yields:
+            Issue dictionaries
+        """
+        if self.token:
+            # Raw REST path: no per-item Issue wrapper construction
+            issues = map(
+                self._raw_issue_to_dict,
+                self._list_issues_raw(repo_name, state=state, **filters),
+            )
+        else:
+            repo = self._get_repo_cached(repo_name)
+            # map() dispatches the bound staticmethod in C, skipping the
+            # per-item generator frame of an equivalent comprehension
+            issues = map(self._issue_to_dict, repo.get_issues(state=state, **filters))
+        return itertools.islice(issues, limit) if limit is not None else issues
+
+    def _list_issues_raw(
         self, repo_name: str, state: str = "open", **filters: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Page raw issue JSON from the REST API on the shared session.
+
+        PyGithub builds a lazy wrapper object per issue just so callers can
+        read a handful of fields back out; decoding the page payload
+        directly skips that construction entirely.
+
+        Yields:
+            Raw issue dicts exactly as returned by the API
+        """
+        url = f"https://api.github.com/repos/{repo_name}/issues"
+        params = {"state": state, "per_page": 100, **filters}
+        headers = {
+            "Authorization": f"token {self.token}",
+            "Accept": "application/vnd.github+json",
+        }
+
+        while url:
+            response = SHARED_SESSION.get(
+                url, params=params, headers=headers, timeout=30
+            )
+            response.raise_for_status()
+            if orjson is not None:
+                page = orjson.loads(response.content)
+            else:
+                page = json.loads(response.content)
+            yield from page
+
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else None
+            params = None  # the next URL already carries the query string
+
+    @staticmethod
+    def _raw_issue_to_dict(rd: Dict[str, Any]) -> Dict[str, Any]:
+        """Project a raw API issue dict onto the fields callers rely on."""
+        return {
+            "number": rd["number"],
+            "title": rd["title"],
+            "body": rd.get("body"),
+            "state": rd["state"],
+            "labels": [label["name"] for label in rd["labels"]],
+            "created_at": rd["created_at"],
+            "updated_at": rd["updated_at"],
+            "closed_at": rd.get("closed_at"),
+            "url": rd["html_url"],
+            "user": (rd.get("user") or {}).get("login"),
+            "assignees": [assignee["login"] for assignee in rd.get("assignees", [])],
+        }
+
+    def list_issues(
+        self,
+        repo_name: str,
+        state: str = "open",
+        limit: Optional[int] = None,
+        **filters: Any,
     ) -> List[Dict[str, Any]]:
         """List issues in a repository.
 
         Args:
             repo_name: Repository name with owner
             state: Issue state ('open', 'closed', 'all')
+            limit: Maximum number of issues to return
             **filters: Additional GitHub issue filters
 
         Returns:
             List of issues
         """
-        repo = self.client.get_repo(repo_name)
-        issues = repo.get_issues(state=state, **filters)
-        return [self._issue_to_dict(issue) for issue in issues]
+        cache_key = (repo_name, state, limit, frozenset(filters.items()))
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._issues_cache.get(cache_key)
+            if entry and entry[0] > now:
+                return copy.copy(entry[1])
+
+        result = list(self.iter_issues(repo_name, state=state, limit=limit, **filters))
+
+        with self._cache_lock:
+            self._issues_cache[cache_key] = (now + self.ISSUES_CACHE_TTL, result)
+
+        return copy.copy(result)
+
+    def list_issues_many(
+        self,
+        repo_names: List[str],
+        state: str = "open",
+        max_workers: int = 8,
+        **filters: Any,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """List issues across many repositories concurrently.
+
+        The per-repo listings are independent IO-bound requests, so a bounded
+        thread pool overlaps their round trips; the client's connection pool
+        (pool_size=32) covers the worker count.
+
+        Args:
+            repo_names: Repository names with owner
+            state: Issue state ('open', 'closed', 'all')
+            max_workers: Upper bound on concurrent listings
+            **filters: Additional GitHub issue filters
+
+        Returns:
+            Mapping of repo name to its list of issues
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        if not repo_names:
+            return {}
+
+        workers = min(max_workers, len(repo_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.list_issues, name, state=state, **filters): name
+                for name in repo_names
+            }
+            return {futures[f]: f.result() for f in as_completed(futures)}
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a GraphQL request against the GitHub API."""
+        if self._graphql_session is None:
+            session = requests.Session()
+            session.headers["Authorization"] = f"bearer {self.token}"
+            # Pace GraphQL calls off the same header-driven token bucket as
+            # the shared REST session, so bulk mutations don't burst into 429s
+            adapter = RateLimitAdapter(RATE_LIMITER, max_retries=RETRY_POLICY)
+            session.mount("https://", adapter)
+            self._graphql_session = session
+
+        response = self._graphql_session.post(
+            self.GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            timeout=30,
+        )
+        response.raise_for_status()
+        data = response.json()
+        if data.get("errors"):
+            raise RuntimeError(f"GraphQL request failed: {data['errors']}")
+        return data["data"]
+
+    def _get_repo_node_id(self, repo_name: str) -> str:
+        """Resolve (and cache) the GraphQL node ID of a repository."""
+        node_id = self._node_id_cache.get(repo_name)
+        if node_id is None:
+            owner, name = repo_name.split("/", 1)
+            data = self._graphql(
+                "query($owner: String!, $name: String!) {"
+                " repository(owner: $owner, name: $name) { id } }",
+                {"owner": owner, "name": name},
+            )
+            node_id = data["repository"]["id"]
+            self._node_id_cache[repo_name] = node_id
+        return node_id
+
+    def create_issues_bulk(
+        self, repo_name: str, issues: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Create many issues with aliased GraphQL createIssue mutations.
+
+        One HTTPS round trip opens up to GRAPHQL_BULK_CHUNK issues, instead of
+        one REST POST (plus repo resolution) per issue. Labels/assignees are
+        not part of CreateIssueInput by name; apply them post-create via the
+        REST ``update_issue`` if needed.
+
+        Args:
+            repo_name: Repository name with owner (e.g., 'owner/repo')
+            issues: Dicts with 'title' and optional 'body' keys
+
+        Returns:
+            List of created issues with 'number', 'title' and 'url'
+        """
+        if not issues:
+            return []
+
+        repository_id = self._get_repo_node_id(repo_name)
+        created: List[Dict[str, Any]] = []
+
+        for start in range(0, len(issues), self.GRAPHQL_BULK_CHUNK):
+            chunk = issues[start : start + self.GRAPHQL_BULK_CHUNK]
+            var_defs = []
+            fields = []
+            variables: Dict[str, Any] = {}
+
+            for i, issue in enumerate(chunk):
+                var_defs.append(f"$i{i}: CreateIssueInput!")
+                fields.append(
+                    f"a{i}: createIssue(input: $i{i})"
+                    " { issue { number title url } }"
+                )
+                variables[f"i{i}"] = {
+                    "repositoryId": repository_id,
+                    "title": issue["title"],
+                    "body": issue.get("body", ""),
+                }
+
+            query = f"mutation({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
+            data = self._graphql(query, variables)
+            created.extend(data[f"a{i}"]["issue"] for i in range(len(chunk)))
+
+        # New issues make cached listings for this repo stale
+        with self._cache_lock:
+            for key in [k for k in self._issues_cache if k[0] == repo_name]:
+                del self._issues_cache[key]
+
+        return created
 
     @staticmethod
-    def _issue_to_dict(issue: Issue) -> Dict[str, Any]:
-        """Convert GitHub Issue object to dictionary."""
-        return {
-            "number": issue.number,
-            "title": issue.title,
-            "body": issue.body,
-            "state": issue.state,
-            "labels": [label.name for label in issue.labels],
-            "created_at": issue.created_at.isoformat(),
-            "updated_at": issue.updated_at.isoformat(),
-            "closed_at": issue.closed_at.isoformat() if issue.closed_at else None,
-            "url": issue.html_url,
-            "user": issue.user.login if issue.user else None,
-            "assignees": [assignee.login for assignee in issue.assignees],
-        }
+    def _issue_to_dict(issue: "Issue") -> Dict[str, Any]:
+        """Convert GitHub Issue object to dictionary.
+
+        Reads ``raw_data`` once instead of going through PyGithub's lazy
+        attribute properties, which each pay property dispatch and wrapper
+        object construction per issue. The API already returns ISO-8601
+        timestamp strings, so no ``isoformat()`` round trip is needed.
+        """
+        return GitHubIntegration._raw_issue_to_dict(issue.raw_data)
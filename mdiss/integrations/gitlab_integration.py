@@ -1,14 +1,31 @@
 """GitLab integration for issue management."""
+import functools
+import operator
 import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import gitlab
 from dotenv import load_dotenv
 
+from ._http import SHARED_SESSION
+
+if TYPE_CHECKING:
+    import gitlab
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> None:
+    """Read .env a single time per process instead of per instance."""
+    load_dotenv()
+
 
 class GitLabIntegration:
     """Handles GitLab API interactions for issue management."""
 
+    # How long (seconds) a cached project object stays fresh
+    PROJECT_CACHE_TTL = 300.0
+
     def __init__(self, token: Optional[str] = None, url: Optional[str] = None):
         """Initialize GitLab integration.
 
@@ -16,18 +33,42 @@ class GitLabIntegration:
             token: GitLab private token with API access
             url: GitLab instance URL (defaults to gitlab.com)
         """
-        load_dotenv()
+        _load_env_once()
         self.token = token or os.getenv("GITLAB_TOKEN")
         self.url = url or os.getenv("GITLAB_URL", "https://gitlab.com")
         self.client = self._get_client()
 
-    def _get_client(self) -> gitlab.Gitlab:
+        # Repeated calls for the same project reuse the resolved object
+        # instead of paying a projects.get round trip each time
+        self._cache_lock = threading.Lock()
+        self._project_cache: Dict[str, tuple] = {}
+
+    def _get_client(self) -> "gitlab.Gitlab":
         """Initialize and return GitLab client."""
+        # Deferred: python-gitlab only loads when a client is constructed
+        import gitlab
+
         if not self.token:
             raise ValueError(
                 "GitLab token is required. Set GITLAB_TOKEN environment variable."
             )
-        return gitlab.Gitlab(self.url, private_token=self.token)
+        # The shared session keeps TLS connections alive across instances
+        return gitlab.Gitlab(
+            self.url, private_token=self.token, session=SHARED_SESSION
+        )
+
+    def _get_project_cached(self, project_id: str):
+        """Resolve a project object, reusing it within the TTL window."""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._project_cache.get(project_id)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        project = self.client.projects.get(project_id)
+        with self._cache_lock:
+            self._project_cache[project_id] = (now + self.PROJECT_CACHE_TTL, project)
+        return project
 
     def create_issue(
         self,
@@ -49,7 +90,7 @@ class GitLabIntegration:
         Returns:
             Created issue data
         """
-        project = self.client.projects.get(project_id)
+        project = self._get_project_cached(project_id)
         issue = project.issues.create(
             {
                 "title": title,
@@ -73,12 +114,30 @@ class GitLabIntegration:
         Returns:
             Updated issue data
         """
-        issue = self.client.projects.get(project_id).issues.get(issue_iid)
+        issue = self._get_project_cached(project_id).issues.get(issue_iid)
         for key, value in kwargs.items():
             setattr(issue, key, value)
         issue.save()
         return issue.attributes
 
+    def iter_issues(self, project_id: str, state: str = "opened", **filters: Any):
+        """Iterate over issues lazily using server-side pagination.
+
+        Args:
+            project_id: Project ID or path with namespace
+            state: Issue state ('opened', 'closed', 'all')
+            **filters: Additional GitLab issue filters
+
+        Yields:
+            Issue dictionaries
+        """
+        project = self._get_project_cached(project_id)
+        # map() with a pre-bound attrgetter converts in C per item
+        return map(
+            operator.attrgetter("attributes"),
+            project.issues.list(state=state, per_page=100, iterator=True, **filters),
+        )
+
     def list_issues(
         self, project_id: str, state: str = "opened", **filters: Any
     ) -> List[Dict[str, Any]]:
@@ -92,6 +151,4 @@ class GitLabIntegration:
         Returns:
             List of issues
         """
-        project = self.client.projects.get(project_id)
-        issues = project.issues.list(state=state, **filters)
-        return [issue.attributes for issue in issues]
+        return list(self.iter_issues(project_id, state=state, **filters))
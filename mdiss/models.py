@@ -1,9 +1,16 @@
 """
-Pydantic models for the mdiss package.
+Models for the mdiss package.
+
+The hot-path records built once per parsed command (FailedCommand,
+AnalysisResult) are msgspec Structs: construction compiles to C and the
+slotted layout costs a fraction of a BaseModel instance. Configuration and
+API-boundary models (GitHubConfig, IssueData) stay on Pydantic for its field
+validation.
 """
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+import msgspec
 from pydantic import BaseModel, Field
 
 
@@ -15,6 +22,15 @@ class Priority(str, Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+    @classmethod
+    def from_value(cls, value: str) -> "Priority":
+        """Resolve a member by value via a plain dict lookup.
+
+        Cheaper than ``Priority(value)`` in ingest loops, which goes
+        through ``EnumMeta.__call__`` for every command.
+        """
+        return PRIORITY_BY_VALUE[value]
+
 
 class Category(str, Enum):
     """Categories for failed commands."""
@@ -23,7 +39,7 @@ class Category(str, Enum):
     NETWORK = "network"
     SYNTAX = "syntax"
     DEPENDENCY = "dependency"
-    DEPENDENCIES = "dependencies"  # Alias for backward compatibility
+    DEPENDENCIES = "dependency"  # True alias: same member as DEPENDENCY
     TIMEOUT = "timeout"
     RESOURCE = "resource"
     BUILD_FAILURE = "build_failure"
@@ -31,22 +47,40 @@ class Category(str, Enum):
     CONFIGURATION = "configuration"
     UNKNOWN = "unknown"
 
+    @classmethod
+    def from_value(cls, value: str) -> "Category":
+        """Resolve a member by value via a plain dict lookup."""
+        return CATEGORY_BY_VALUE[value]
+
+
+# Pre-bound value-to-member maps: dict.get is a single C lookup, while
+# Enum.__call__ walks the metaclass machinery on every coercion
+PRIORITY_BY_VALUE: Dict[str, Priority] = {m.value: m for m in Priority}
+CATEGORY_BY_VALUE: Dict[str, Category] = {m.value: m for m in Category}
 
-class FailedCommand(BaseModel):
+
+class FailedCommand(msgspec.Struct, kw_only=True):
     """Model representing a failed command."""
 
-    title: str = Field(..., description="Title of the failed command")
-    command: str = Field(..., description="The command that failed")
-    source: str = Field(..., description="Source file or context of the command")
-    command_type: str = Field(..., description="Type of the command")
-    status: str = Field(..., description="Status of the command (e.g., 'Failed')")
-    return_code: int = Field(..., description="The return code of the command")
-    execution_time: float = Field(..., description="Execution time in seconds")
-    output: str = Field(default="", description="Standard output of the command")
-    error_output: str = Field(default="", description="Error output of the command")
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict, description="Additional metadata about the command"
-    )
+    title: str
+    command: str
+    source: str
+    command_type: str
+    status: str
+    return_code: int
+    execution_time: float
+    output: str = ""
+    error_output: str = ""
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # msgspec only type-checks on decode, so coerce the numeric
+        # fields here as Pydantic did; a bad value fails at construction
+        # instead of deep inside issue formatting
+        if not isinstance(self.return_code, int):
+            self.return_code = int(self.return_code)
+        if not isinstance(self.execution_time, float):
+            self.execution_time = float(self.execution_time)
 
     # Backward compatibility with exit_code alias
     @property
@@ -73,23 +107,35 @@ class FailedCommand(BaseModel):
         return any(indicator in error_output for indicator in critical_indicators)
 
 
-class AnalysisResult(BaseModel):
+class AnalysisResult(msgspec.Struct, kw_only=True):
     """Result of analyzing a failed command."""
 
-    priority: Priority = Field(..., description="Priority level of the issue")
-    category: Category = Field(..., description="Category of the issue")
-    root_cause: Optional[str] = Field(
-        None, description="Identified root cause of the failure"
-    )
-    suggested_solution: Optional[str] = Field(
-        None, description="Suggested solution for the issue"
-    )
-    confidence: float = Field(
-        0.0, ge=0.0, le=1.0, description="Confidence level of the analysis (0.0 to 1.0)"
-    )
-    additional_info: Dict[str, Any] = Field(
-        default_factory=dict, description="Additional analysis information"
-    )
+    priority: Priority
+    category: Category
+    root_cause: Optional[str] = None
+    suggested_solution: Optional[str] = None
+    confidence: float = 0.0
+    additional_info: Dict[str, Any] = msgspec.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Accept raw string values for the enum fields; the dict-backed
+        # from_value lookup keeps coercion off the EnumMeta slow path
+        if not isinstance(self.priority, Priority):
+            try:
+                self.priority = Priority.from_value(self.priority)
+            except KeyError:
+                raise ValueError(f"Invalid priority: {self.priority!r}") from None
+        if not isinstance(self.category, Category):
+            try:
+                self.category = Category.from_value(self.category)
+            except KeyError:
+                raise ValueError(f"Invalid category: {self.category!r}") from None
+        if not isinstance(self.confidence, float):
+            self.confidence = float(self.confidence)
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(
+                f"confidence must be between 0 and 1, got {self.confidence}"
+            )
 
 
 class GitHubConfig(BaseModel):
@@ -3,14 +3,29 @@ Slack notification service for mdiss.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # C encoder; optional, stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from ..models import Category, FailedCommand, Priority
 
 
+def _encode_payload(payload: Dict) -> bytes:
+    """Serialize a webhook payload, preferring orjson's C encoder."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
 class SlackNotificationService:
     """Service for sending Slack notifications."""
 
@@ -18,5 +33,95 @@ class SlackNotificationService:
         self.webhook_url = webhook_url
         self.session = requests.Session()
 
-    def send_failure_summary(self, commands: List[FailedCommand],
-                           title: str = "Build Failures Detected") -> bool:
+        # Keep-alive with a sized pool plus retry/backoff: bursts of failure
+        # notifications reuse one TLS connection instead of paying a full
+        # handshake per send, and transient 429/5xx are absorbed with backoff.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
+
+        # Static skeleton built once; per-send work is limited to the
+        # dynamic summary block and one C-level encode
+        self._header_block = {
+            "type": "header",
+            "text": {"type": "plain_text", "text": ""},
+        }
+
+        # Webhook POSTs ride on a small background pool so a slow Slack
+        # response never blocks the main pipeline; close() drains it
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="slack")
+
+    def send_failure_summary(
+        self, commands: List[FailedCommand], title: str = "Build Failures Detected"
+    ) -> bool:
+        """Send a summary of failed commands to Slack.
+
+        Args:
+            commands: Failed commands to summarize
+            title: Headline shown at the top of the message
+
+        The payload is built synchronously; the POST itself runs on the
+        background pool so callers never wait out the Slack round trip.
+
+        Returns:
+            True if the notification was queued, False otherwise
+        """
+        if not commands:
+            return True
+
+        payload = self._build_summary_payload(commands, title)
+        self._executor.submit(self._post, payload)
+        return True
+
+    def close(self) -> None:
+        """Drain pending notifications and shut down the background pool."""
+        self._executor.shutdown(wait=True)
+
+    def _build_summary_payload(
+        self, commands: List[FailedCommand], title: str
+    ) -> Dict:
+        """Build the Slack blocks payload for a failure summary."""
+        lines = [
+            f"• *{cmd.title}* (`{cmd.command}`) - exit code {cmd.return_code}"
+            for cmd in commands[:10]
+        ]
+        if len(commands) > 10:
+            lines.append(f"... and {len(commands) - 10} more")
+
+        header = dict(self._header_block)
+        header["text"] = {"type": "plain_text", "text": title}
+
+        return {
+            "blocks": [
+                header,
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"*{len(commands)}* failed commands detected at "
+                        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}:\n"
+                        + "\n".join(lines),
+                    },
+                },
+            ]
+        }
+
+    def _post(self, payload: Dict) -> bool:
+        """POST a payload to the configured webhook."""
+        try:
+            response = self.session.post(
+                self.webhook_url, data=_encode_payload(payload), timeout=10
+            )
+            return response.status_code == 200
+        except requests.exceptions.RequestException:
+            return False
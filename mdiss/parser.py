@@ -2,12 +2,385 @@
 Markdown Parser for extracting code blocks and commands from markdown files.
 """
 
+import copy
+import hashlib
+import logging
+import mmap
+import os
 import re
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any, Dict, List, Optional, Tuple
 
+import msgspec
+
 from .models import FailedCommand
 
+try:  # Optional: possessive quantifiers guarantee linear-time matching
+    import regex as _regex
+except ImportError:  # pragma: no cover
+    _regex = None
+
+try:  # Optional: SIMD newline scanning for multi-MB documents
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None
+
+logger = logging.getLogger(__name__)
+
+# Deletion table covering the emoji blocks seen in status strings:
+# str.translate drops the codepoints in C without running the regex engine
+_EMOJI_TRANS = dict.fromkeys(
+    [
+        *range(0x1F600, 0x1F650),  # emoticons
+        *range(0x1F300, 0x1F600),  # symbols & pictographs
+        *range(0x1F680, 0x1F700),  # transport & map symbols
+        *range(0x1F1E0, 0x1F200),  # regional indicators (flags)
+        *range(0x2600, 0x2700),  # miscellaneous symbols
+        *range(0x2700, 0x27C0),  # dingbats
+    ]
+)
+
+# Patterns compiled once at import: per-line re.match(str, ...) calls pay a
+# cache lookup (and can thrash re's 512-entry cache) on every invocation
+if _regex is not None:
+    # Possessive (++/*+) forms cannot backtrack, so adversarial lines with
+    # long runs of '**' and no closing ':**' still match in linear time
+    _TITLE_RE = _regex.compile(r"^##\s++\d++\.\s++([^\n]+?)(?:\s*\*\*)?$")
+    _SECTION_HDR_RE = _regex.compile(
+        r"(?m)^###?[ \t]*+(?:\*\*([^\n]+?)\*\*|([^:\n]+?)):?[ \t]*+$"
+    )
+    _KV_RE = _regex.compile(r"^\s*+[\*\-]?+\s*+\*\*([^:\n]++):\*\*\s*+([^\n]+?)\s*+$")
+else:
+    _TITLE_RE = re.compile(r"^##\s+\d+\.\s+(.+?)(?:\s*\*\*)?$")
+    # Bold and plain section headers in one alternation (multiline, so one
+    # finditer pass covers a whole section instead of a match call per line)
+    _SECTION_HDR_RE = re.compile(
+        r"(?m)^###?[ \t]*(?:\*\*(.+?)\*\*|([^:\n]+?)):?[ \t]*$"
+    )
+    _KV_RE = re.compile(r"^\s*[\*\-]?\s*\*\*([^:\n]+):\*\*\s*(.+?)\s*$")
+
+# Fenced code blocks, bare or language-tagged; DOTALL body extracted in one
+# C-level SRE scan instead of toggling per line in Python
+_FENCE_RE = re.compile(r"(?ms)^(?:```|~~~)\w*[ \t]*\n(.*?)^(?:```|~~~)[ \t]*$")
+_META_RE = re.compile(r"\*\*([^:]+):\*\*\s*([^\n]+)")
+_KEY_RE = re.compile(r"\*\*([^:]+):\*\*")
+
+# '---\n\n## ' section separators in the failed-commands format
+_FAILED_SEP_RE = re.compile(r"---\n\n## ")
+
+# Key-value blocks in a failed-command section: one multiline scan captures
+# each '**Key:** value' pair together with its continuation lines, up to the
+# next key or the end of the section
+_KV_BLOCK_RE = re.compile(
+    r"(?ms)^[ \t]*\*\*([^:\n]+):\*\*[ \t]*(.*?)(?=^[ \t]*\*\*[^:\n]+:\*\*|\Z)"
+)
+
+# Normalized status values, looked up after emoji stripping
+_STATUS_MAP = {
+    "❌ Failed": "Failed",
+    "✅ Passed": "Passed",
+    "⚠️ Warning": "Warning",
+    "⏱️ Timeout": "Timeout",
+}
+
+
+class ParsedCommand(msgspec.Struct):
+    """One extracted shell command.
+
+    A slotted Struct instead of a dict: fixed layout, a fraction of the
+    memory per record, and C-level attribute reads. ``__getitem__``/``get``
+    keep the historical dict-style access working.
+    """
+
+    command: str
+    line_number: int
+    original_line: str
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return msgspec.structs.asdict(self)
+
+
+class ParsedBlock:
+    """One fenced code block plus the commands extracted from it.
+
+    Lazy record: the body is stored as a span into the original document,
+    and the substring copy plus command extraction happen only on first
+    access. Result sets over large logs therefore retain one shared
+    buffer reference per document instead of a copied block per entry.
+    """
+
+    __slots__ = ("file", "start_line", "_content", "_span", "_block", "_commands")
+
+    def __init__(
+        self,
+        file: Optional[str],
+        start_line: int,
+        content: str = "",
+        span: Tuple[int, int] = (0, 0),
+        code_block: Optional[str] = None,
+        commands: Optional[List[ParsedCommand]] = None,
+    ):
+        self.file = file
+        self.start_line = start_line
+        self._content = content
+        self._span = span
+        self._block = code_block
+        self._commands = commands
+
+    @property
+    def code_block(self) -> str:
+        block = self._block
+        if block is None:
+            start, end = self._span
+            block = self._content[start:end].strip()
+            self._block = block
+            # The buffer is no longer needed once the slice is realized
+            self._content = ""
+        return block
+
+    @property
+    def end_line(self) -> int:
+        return self.start_line + self.code_block.count("\n")
+
+    @property
+    def commands(self) -> List[ParsedCommand]:
+        cmds = self._commands
+        if cmds is None:
+            cmds = self._commands = _extract_commands(self.code_block)
+        return cmds
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ParsedBlock):
+            return NotImplemented
+        return (
+            self.file == other.file
+            and self.start_line == other.start_line
+            and self.code_block == other.code_block
+            and self.commands == other.commands
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ParsedBlock(file={self.file!r}, start_line={self.start_line}, "
+            f"code_block={self.code_block!r})"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "file": self.file,
+            "code_block": self.code_block,
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+            "commands": [cmd.to_dict() for cmd in self.commands],
+        }
+
+
+def _set_command(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    cmd_data["command"] = value.strip("`")
+
+
+def _set_source(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    cmd_data["source"] = value
+
+
+def _set_command_type(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    cmd_data["command_type"] = value.lower()
+
+
+def _set_status(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    cmd_data["status"] = parser._clean_status(value)
+
+
+def _set_return_code(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    try:
+        cmd_data["return_code"] = int(value)
+    except (ValueError, TypeError):
+        cmd_data["return_code"] = 1
+
+
+def _set_execution_time(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    try:
+        cmd_data["execution_time"] = float(value.rstrip("s").strip())
+    except (ValueError, TypeError):
+        pass
+
+
+def _set_output(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    cmd_data["output"] = value
+
+
+def _set_error_output(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    cmd_data["error_output"] = value
+
+
+def _set_metadata(parser, cmd_data: Dict[str, Any], value: str) -> None:
+    cmd_data["metadata"] = parser._parse_metadata(value)
+
+
+# One hash lookup per metadata key instead of a linear if/elif chain;
+# aliases map straight to the same handler so no normalization is needed
+_KEY_HANDLERS = {
+    "command": _set_command,
+    "source": _set_source,
+    "type": _set_command_type,
+    "status": _set_status,
+    "return code": _set_return_code,
+    "return_code": _set_return_code,
+    "execution time": _set_execution_time,
+    "execution_time": _set_execution_time,
+    "output": _set_output,
+    "stdout": _set_output,
+    "error": _set_error_output,
+    "error_output": _set_error_output,
+    "stderr": _set_error_output,
+    "metadata": _set_metadata,
+}
+
+
+def _parse_one(path: str) -> List[Dict[str, Any]]:
+    """Parse a single file in a worker process (module-level for pickling)."""
+    return MarkdownParser().parse_file(path)
+
+
+# Files at or above this size are memory-mapped instead of buffered in
+_MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+
+def _read_text(path: Path, size: int) -> str:
+    """Read a file as UTF-8 text, memory-mapping it when large.
+
+    ``Path.read_text`` materializes the raw bytes and then the decoded str —
+    two full-size allocations. For large files, decoding straight off a
+    read-only map skips the intermediate bytes object and lets the kernel
+    page the file in sequentially.
+    """
+    if size < _MMAP_THRESHOLD:
+        return path.read_text(encoding="utf-8")
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8", "replace")
+
+
+@lru_cache(maxsize=1)
+def _code_block_re() -> "re.Pattern":
+    # The regex module's engine handles non-greedy scans measurably faster
+    # than SRE; the stdlib pattern is the fallback
+    engine = _regex if _regex is not None else re
+    return engine.compile(r"```(?:\w+)?\s*\n(.*?)```", re.DOTALL | re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
+def _command_re() -> "re.Pattern":
+    engine = _regex if _regex is not None else re
+    return engine.compile(r"^\s*\$\s*(.+?)(?:\s*#|$)", re.MULTILINE)
+
+
+def _iter_fenced_blocks(content: str):
+    """Walk ``content`` once, yielding (fence, body_start, body_end) spans.
+
+    A forward str.find scan replaces the DOTALL ``.*?`` regex, which drags
+    the SRE engine through character-by-character backtracking across the
+    whole document; this scan is guaranteed linear and immune to
+    pathological inputs. Yielding offsets rather than substrings keeps the
+    scan zero-copy; callers slice only the spans they actually need.
+    """
+    find = content.find
+    pos = 0
+    while True:
+        start = find("```", pos)
+        if start == -1:
+            return
+        newline = find("\n", start + 3)
+        if newline == -1:
+            return
+        # The fence info string may only be a bare word (e.g. ```bash)
+        info = content[start + 3 : newline].rstrip()
+        if info and not info.replace("_", "").isalnum():
+            pos = start + 3
+            continue
+        end = find("```", newline + 1)
+        if end == -1:
+            return
+        yield start, newline + 1, end
+        pos = end + 3
+
+
+def _span_is_blank(content: str, start: int, end: int) -> bool:
+    """True if the span holds only whitespace; short-circuits without a copy."""
+    for i in range(start, end):
+        if not content[i].isspace():
+            return False
+    return True
+
+
+def _extract_commands(text: str) -> List[ParsedCommand]:
+    """Extract '$'-prefixed shell commands from a code block body.
+
+    Almost no lines start with '$', so a startswith byte test per line
+    beats running a multiline regex engine over the whole block.
+    """
+    commands = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        stripped = line.lstrip()
+        if not stripped.startswith("$"):
+            continue
+        command = stripped[1:].lstrip().split("#", 1)[0].strip()
+        if command:
+            commands.append(
+                ParsedCommand(
+                    command=command,
+                    line_number=line_number,
+                    original_line=line.strip(),
+                )
+            )
+    return commands
+
+
+def _newline_offsets(content: str) -> List[int]:
+    """Offsets of every newline in ``content``, for bisect line lookups.
+
+    Scanning once up front replaces the per-match
+    ``content[:match.start()].count("\\n")`` idiom, which slices and scans
+    from offset zero for every match (O(N*M) on block-heavy files).
+
+    Multi-MB ASCII documents take a vectorized path when NumPy is
+    installed: one comparison over the byte array runs at memory
+    bandwidth. Non-ASCII content falls back to the find loop because
+    byte offsets would no longer line up with str indices.
+    """
+    if (
+        _np is not None
+        and len(content) >= _MMAP_THRESHOLD
+        and content.isascii()
+    ):
+        arr = _np.frombuffer(content.encode("ascii"), dtype=_np.uint8)
+        return _np.nonzero(arr == 10)[0].tolist()
+
+    offsets = []
+    append = offsets.append
+    find = content.find
+    i = find("\n")
+    while i != -1:
+        append(i)
+        i = find("\n", i + 1)
+    return offsets
+
 
 class MarkdownParser:
     """Parser for extracting code blocks and commands from markdown files.
@@ -17,12 +390,29 @@ class MarkdownParser:
     2. Markdown sections with command details (## 1. Command: ...)
     """
 
+    # Bound on cached parse results (LRU eviction past this)
+    PARSE_CACHE_SIZE = 32
+
     def __init__(self):
         """Initialize the MarkdownParser."""
-        self.code_block_pattern = re.compile(
-            r"```(?:\w+)?\s*\n(.*?)```", re.DOTALL | re.MULTILINE
-        )
-        self.command_pattern = re.compile(r"^\s*\$\s*(.+?)(?:\s*#|$)", re.MULTILINE)
+        # Parse results keyed by (path, mtime_ns, size): repeat calls for an
+        # unchanged file skip the read and the full parse
+        self._parse_cache: OrderedDict = OrderedDict()
+        # parse_content results keyed by a blake2b digest of the content, so
+        # re-parsing an identical document (CLI iterations, test loops) is a
+        # hash plus a dict lookup
+        self._content_cache: OrderedDict = OrderedDict()
+
+    # Compiled on first use so constructing a parser (e.g. for
+    # get_statistics only) pays no SRE compilation cost; the lru_cache
+    # helpers share one compiled pattern across all instances
+    @cached_property
+    def code_block_pattern(self):
+        return _code_block_re()
+
+    @cached_property
+    def command_pattern(self):
+        return _command_re()
 
     def _clean_status(self, status: str) -> str:
         """
@@ -37,23 +427,14 @@ class MarkdownParser:
         if not status:
             return ""
 
-        # Remove emojis and extra whitespace
-        status = re.sub(
-            r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\u2600-\u26FF\u2700-\u27BF]",
-            "",
-            status,
-        )
-        status = status.strip()
-
-        # Normalize common status values
-        status_map = {
-            "❌ Failed": "Failed",
-            "✅ Passed": "Passed",
-            "⚠️ Warning": "Warning",
-            "⏱️ Timeout": "Timeout",
-        }
+        # ASCII statuses (the common case for parsed CLI output) cannot
+        # contain emojis, so skip the translate pass entirely
+        if status.isascii():
+            status = status.strip()
+        else:
+            status = status.translate(_EMOJI_TRANS).strip()
 
-        return status_map.get(status, status)
+        return _STATUS_MAP.get(status, status)
 
     def _parse_metadata(self, metadata_text: str) -> Dict[str, str]:
         """
@@ -70,9 +451,7 @@ class MarkdownParser:
             return metadata
 
         # Match lines with **key:** value format
-        pattern = r"\*\*([^:]+):\*\*\s*([^\n]+)"
-
-        for match in re.finditer(pattern, metadata_text):
+        for match in _META_RE.finditer(metadata_text):
             key = match.group(1).strip()
             value = match.group(2).strip()
             if key and value:
@@ -94,120 +473,44 @@ class MarkdownParser:
         if not value:
             return
 
-        key_lower = key.lower()
-
-        if key_lower == "command":
-            cmd_data["command"] = value.strip("`")
-        elif key_lower == "source":
-            cmd_data["source"] = value
-        elif key_lower == "type":
-            cmd_data["command_type"] = value.lower()
-        elif key_lower == "status":
-            cmd_data["status"] = self._clean_status(value)
-        elif key_lower in ("return code", "return_code"):
-            try:
-                cmd_data["return_code"] = int(value)
-            except (ValueError, TypeError):
-                cmd_data["return_code"] = 1
-        elif key_lower in ("execution time", "execution_time"):
-            try:
-                cmd_data["execution_time"] = float(value.rstrip("s").strip())
-            except (ValueError, TypeError):
-                pass
-        elif key_lower in ("output", "stdout"):
-            cmd_data["output"] = value
-        elif key_lower in ("error", "error_output", "stderr"):
-            cmd_data["error_output"] = value
-        elif key_lower == "metadata":
-            cmd_data["metadata"] = self._parse_metadata(value)
+        handler = _KEY_HANDLERS.get(key.lower())
+        if handler is not None:
+            handler(self, cmd_data, value)
 
     def _parse_todo_format(self, content: str, file_path: str) -> List[Dict[str, Any]]:
         """Parse the TODO.md format with command sections."""
-        print(f"[DEBUG] Starting _parse_todo_format for file: {file_path}")
-        commands = []
-        current_cmd = {}
-        current_section = None
-        in_code_block = False
-        code_block_content = []
-
-        lines = content.split("\n")
-        print(f"[DEBUG] Total lines to process: {len(lines)}")
-
-        def finalize_command():
-            nonlocal current_cmd, current_section, code_block_content
-            if current_cmd:
-                print(
-                    f"[DEBUG] Finalizing command: {current_cmd.get('title', 'Untitled')}"
-                )
-                # Save any remaining code block content
-                if code_block_content and current_section:
-                    content = "\n".join(code_block_content).strip("\n")
-                    print(
-                        f"[DEBUG] Finalizing section '{current_section}' with content: {content[:100]}..."
-                    )
-                    if content:
-                        if current_section == "error_output":
-                            print("[DEBUG] Processing error_output in finalize_command")
-                            if "error_output" in current_cmd:
-                                current_cmd["error_output"] = (
-                                    current_cmd["error_output"].rstrip("\n")
-                                    + "\n"
-                                    + content
-                                )
-                                print(f"[DEBUG] Appended to existing error_output")
-                            else:
-                                current_cmd["error_output"] = content
-                                print("[DEBUG] Created new error_output")
-                            print(
-                                f"[DEBUG] error_output after update: {current_cmd.get('error_output', '')[:100]}..."
-                            )
-                        else:
-                            current_cmd[current_section] = content
-
-                # Clean up the command data
-                if "command" in current_cmd:
-                    # Remove the backticks from the command if present
-                    current_cmd["command"] = current_cmd["command"].strip("`")
-                    print(f"[DEBUG] Final command data: {current_cmd}")
-                    commands.append(current_cmd)
-                else:
-                    print("[WARNING] Command missing 'command' field, skipping")
-                current_cmd = {}
-            else:
-                print("[DEBUG] No current command to finalize")
-            current_section = None
-            code_block_content = []
-            print("[DEBUG] Command finalized")
-
-        # Split content into sections using the --- separator
-        sections = content.split("---")
-        print(f"[DEBUG] Found {len(sections)} sections in the file")
-
-        for section in sections:
-            section = section.strip()
-            if not section:
-                continue
+        return list(self._iter_todo_commands(content.split("\n"), file_path))
 
-            print(f"[DEBUG] Processing section: {section[:100]}...")
+    def _iter_todo_commands(self, lines, file_path: str):
+        """Yield TODO-format commands from an iterable of lines.
 
-            # Extract the command title from the first line
-            lines = section.split("\n")
-            title_match = re.match(
-                r"^##\s+\d+\.\s+(.+?)(?:\s*\*\*)?$", lines[0].strip()
-            )
-            if not title_match:
-                print(
-                    f"[DEBUG] Skipping section with invalid title: {lines[0][:50]}..."
-                )
-                continue
+        Driving the parse off a line stream keeps peak memory at one
+        section rather than the whole file, and lets ``parse_file`` feed an
+        open file handle directly. Sections are delimited by ``---`` lines.
+
+        Args:
+            lines: Iterable of lines (an open file handle works)
+            file_path: Path recorded on each command
 
-            title = title_match.group(1).strip()
-            print(f"[DEBUG] Found command section: {title}")
+        Yields:
+            Command dictionaries
+        """
+        section_lines: List[str] = []
+
+        def build_command() -> Optional[Dict[str, Any]]:
+            # Drop leading blanks, then require a numbered title line
+            start = 0
+            end = len(section_lines)
+            while start < end and not section_lines[start].strip():
+                start += 1
+            if start == end:
+                return None
+            title_match = _TITLE_RE.match(section_lines[start].strip())
+            if not title_match:
+                return None
 
-            # Initialize new command
-            finalize_command()
             current_cmd = {
-                "title": title,
+                "title": title_match.group(1).strip(),
                 "file": file_path,
                 "command": "",
                 "command_type": "shell",
@@ -219,177 +522,134 @@ class MarkdownParser:
                 "source": file_path,
                 "metadata": {},
             }
+            # Feed the body lines straight through; joining them into one
+            # string only for _process_section_content to re-split again
+            # would double the memory traffic per section
+            self._process_section_lines(section_lines[start + 1 :], current_cmd)
+            # Remove the backticks from the command if present
+            current_cmd["command"] = current_cmd["command"].strip("`")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Finalized command: %s", current_cmd["title"])
+            return current_cmd
 
-            # Process the section content
-            section_content = "\n".join(lines[1:]).strip()
-            self._process_section_content(section_content, current_cmd)
-
-        # Finalize the last command
-        finalize_command()
-
-        print(f"[DEBUG] Parsed {len(commands)} commands from {file_path}")
-        return commands
-
-        return commands
+        for line in lines:
+            line = line.rstrip("\n")
+            if line.strip() == "---":
+                cmd = build_command()
+                if cmd is not None:
+                    yield cmd
+                section_lines = []
+            else:
+                section_lines.append(line)
+
+        cmd = build_command()
+        if cmd is not None:
+            yield cmd
+
+    @staticmethod
+    def _classify_section(name: str) -> Optional[str]:
+        """Map a header name onto the command field it feeds, if any."""
+        if "command" in name:
+            return "command"
+        if "output" in name and "error" not in name:
+            return "output"
+        if "error" in name or "stderr" in name:
+            return "error_output"
+        if "suggested" in name and "solution" in name:
+            return "suggested_solution"
+        if "metadata" in name:
+            return "metadata"
+        return None
 
     def _process_section_content(
         self, content: str, current_cmd: Dict[str, Any]
     ) -> None:
-        """Process the content of a section and update the command data."""
-        lines = content.split("\n")
-        current_section = None
-        in_code_block = False
-        code_block_content = []
-
-        # Debug: Print the raw content being processed
-        print(f"\n[DEBUG] ===== PROCESSING SECTION CONTENT =====")
-        print(f"[DEBUG] Current command: {current_cmd.get('title', 'Untitled')}")
-        print(f"[DEBUG] Initial content (first 200 chars): {content[:200]}...")
-        print(f"[DEBUG] Total lines to process: {len(lines)}")
-        print("[DEBUG] =======================================")
-
-        for line in lines:
-            line = line.rstrip()
-
-            # Handle code blocks
-            if line.strip() in ("```", "~~~"):
-                print(f"[DEBUG] {'End' if in_code_block else 'Start'} of code block")
-                in_code_block = not in_code_block
-                if not in_code_block and code_block_content and current_section:
-                    # End of code block, save the content
-                    block_content = "\n".join(code_block_content).strip("\n")
-                    print(
-                        f"[DEBUG] Saving code block content for section '{current_section}': {block_content[:100]}..."
-                    )
-                    if block_content:
-                        if current_section == "error_output":
-                            print("[DEBUG] Appending to error output section")
-                            if "error_output" in current_cmd:
-                                current_cmd["error_output"] = (
-                                    current_cmd["error_output"].rstrip("\n")
-                                    + "\n"
-                                    + block_content
-                                )
-                            else:
-                                current_cmd["error_output"] = block_content
-                            print(
-                                f"[DEBUG] Current error_output: {current_cmd.get('error_output', '')[:100]}..."
-                            )
-                        else:
-                            current_cmd[current_section] = block_content
-                    code_block_content = []
-                continue
+        """Process the content of a section and update the command data.
 
-            if in_code_block:
-                print(f"[DEBUG] Adding line to code block: {line}")
-                code_block_content.append(line)
-                continue
-
-            # Check for section headers (supports both **bold** and plain text headers)
-            section_match = re.match(r"^###?\s*\*\*(.+?)\*\*:?\s*$", line) or re.match(
-                r"^###?\s*([^:]+):?\s*$", line
-            )
-            if section_match:
-                section = section_match.group(1).lower()
-                print(f"\n[DEBUG] ===== FOUND SECTION HEADER =====")
-                print(f"[DEBUG] Raw line: {line}")
-                print(f"[DEBUG] Matched section: {section}")
-                print(f"[DEBUG] Group 1: {section_match.group(1)}")
-                print(f"[DEBUG] Group 0: {section_match.group(0)}")
-
-                # Finalize previous section if any
-                if current_section:
-                    print(f"[DEBUG] Finalizing previous section: {current_section}")
-                    self._finalize_section(
-                        current_cmd, current_section, code_block_content
-                    )
-                code_block_content = []
-
-                # Determine section type
-                if "command" in section:
-                    current_section = "command"
-                elif "output" in section and "error" not in section:
-                    current_section = "output"
-                elif any(x in section for x in ["error", "stderr", "error output"]):
-                    current_section = "error_output"
-                    print("[DEBUG] Set current_section to 'error_output'")
-                elif "suggested" in section and "solution" in section:
-                    current_section = "suggested_solution"
-                elif "metadata" in section:
-                    current_section = "metadata"
-                else:
-                    current_section = None
-
-                print(f"[DEBUG] Section type determined: {current_section}")
-                print(f"[DEBUG] Current command state: {current_cmd}")
-                print("[DEBUG] =================================")
+        Headers and fenced blocks are located with multiline regex passes,
+        so the bulk of the scanning runs in C instead of a Python loop
+        toggling fence state per line.
+        """
+        # Per-section buffers joined once at the end: repeated
+        # `value + "\n" + line` concatenation is O(n^2) over large dumps
+        buffers: Dict[str, List[str]] = {}
+
+        def append_to(section: str, text: str) -> None:
+            buf = buffers.get(section)
+            if buf is None:
+                existing = current_cmd.get(section)
+                buf = buffers[section] = [existing] if existing else []
+            buf.append(text)
+
+        def append_loose(section: str, text: str) -> None:
+            for line in text.splitlines():
+                line = line.rstrip()
+                # Skip blanks and stray fence markers (unterminated blocks)
+                if line.strip() and not line.startswith(("```", "~~~")):
+                    append_to(section, line)
+
+        headers = list(_SECTION_HDR_RE.finditer(content))
+        for i, header in enumerate(headers):
+            name = (header.group(1) or header.group(2)).lower()
+            section = self._classify_section(name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Section header %r -> %s", header.group(0), section)
+            if section is None:
                 continue
 
-            # Skip empty lines outside of sections
-            if not line.strip() or not current_section:
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+            body = content[header.end() : end]
+
+            if section == "metadata":
+                for line in body.splitlines():
+                    stripped = line.strip()
+                    # Fast path for the common '**key:** value' shape:
+                    # str.partition beats a full regex match per line
+                    if stripped.startswith("**"):
+                        key, sep, rest = stripped[2:].partition(":**")
+                        if sep and key and rest.strip():
+                            self._update_command_data(
+                                current_cmd, key.strip().lower(), rest.strip()
+                            )
+                            continue
+                    # Bulleted lines ('- **key:** value') keep the regex
+                    if stripped.startswith(("*", "-")):
+                        kv_match = _KV_RE.match(line)
+                        if kv_match:
+                            self._update_command_data(
+                                current_cmd,
+                                kv_match.group(1).strip().lower(),
+                                kv_match.group(2).strip(),
+                            )
                 continue
 
-            # Parse key-value pairs for metadata
-            if current_section == "metadata":
-                kv_match = re.match(r"^\s*[\*\-]?\s*\*\*(.+?):\*\*\s*(.+?)\s*$", line)
-                if kv_match:
-                    key = kv_match.group(1).strip().lower()
-                    value = kv_match.group(2).strip()
-                    self._update_command_data(current_cmd, key, value)
-            else:
-                # For error output sections, always append to preserve all content
-                if current_section == "error_output":
-                    print(f"\n[DEBUG] ===== PROCESSING ERROR OUTPUT =====")
-                    print(f"[DEBUG] Current line: {line}")
-                    print(
-                        f"[DEBUG] Current error_output before update: {current_cmd.get('error_output', 'NOT SET')}"
-                    )
-
-                    # Skip empty lines in error output
-                    if line.strip():
-                        if "error_output" not in current_cmd:
-                            current_cmd["error_output"] = line
-                            print("[DEBUG] Created new error_output field")
-                        else:
-                            # Only add newline if the current error_output is not empty
-                            if current_cmd["error_output"]:
-                                current_cmd["error_output"] = (
-                                    current_cmd["error_output"].rstrip("\n")
-                                    + "\n"
-                                    + line
-                                )
-                            else:
-                                current_cmd["error_output"] = line
-                            print("[DEBUG] Appended to existing error_output")
-
-                        print(
-                            f"[DEBUG] error_output after update: {current_cmd.get('error_output', '')[:200]}..."
-                        )
+            last_end = 0
+            for fence in _FENCE_RE.finditer(body):
+                append_loose(section, body[last_end : fence.start()])
+                block_content = fence.group(1)
+                # Strip boundary blank lines only when present, so clean
+                # blocks (the common case) skip the extra copy
+                if block_content[:1] == "\n" or block_content[-1:] == "\n":
+                    block_content = block_content.strip("\n")
+                if block_content:
+                    if section == "error_output":
+                        append_to("error_output", block_content)
                     else:
-                        print("[DEBUG] Skipping empty line in error output")
-                    print("[DEBUG] ====================================")
-                # For other sections, collect the content
-                elif current_section not in current_cmd:
-                    current_cmd[current_section] = line
-                else:
-                    current_cmd[current_section] = (
-                        current_cmd[current_section].rstrip("\n") + "\n" + line
-                    )
-
-    def _finalize_section(
-        self,
-        current_cmd: Dict[str, Any],
-        current_section: str,
-        code_block_content: List[str],
+                        # A code block replaces any loose lines collected
+                        # for the section
+                        buffers[section] = [block_content]
+                last_end = fence.end()
+            append_loose(section, body[last_end:])
+
+        # Flush buffered sections in one join per section
+        for section, buf in buffers.items():
+            current_cmd[section] = "\n".join(buf)
+
+    def _process_section_lines(
+        self, lines: List[str], current_cmd: Dict[str, Any]
     ) -> None:
-        """Finalize the current section by saving any pending code block content."""
-        if code_block_content and current_section:
-            content = "\n".join(code_block_content).strip("\n")
-            if content:
-                if current_section == "error_output" and "error_output" in current_cmd:
-                    current_cmd["error_output"] += "\n" + content
-                else:
-                    current_cmd[current_section] = content
+        """Process already-split section lines (joined once, no re-split)."""
+        self._process_section_content("\n".join(lines), current_cmd)
 
     def parse_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -405,18 +665,35 @@ class MarkdownParser:
             FileNotFoundError: If the specified file does not exist
         """
         path = Path(file_path)
-        if not path.exists() or not path.is_file():
+        # One stat() covers existence, type and the cache key instead of the
+        # exists()/is_file()/stat() triple (three syscalls on every call)
+        try:
+            st = path.stat()
+        except OSError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        if not S_ISREG(st.st_mode):
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        # Key on the caller's spelling of the path: cached records embed it
+        # in their file/source fields, so resolving here would hand a hit
+        # for "/abs/x.md" records that still claim "./x.md"
+        cache_key = (str(path), st.st_mtime_ns, st.st_size)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            self._parse_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
         try:
-            content = path.read_text(encoding="utf-8")
-            # First try the TODO format parser
-            todo_commands = self._parse_todo_format(content, file_path)
+            # First try the TODO format parser, streaming straight off the
+            # file handle so only one section is held in memory at a time
+            with path.open(encoding="utf-8") as fh:
+                todo_commands = list(self._iter_todo_commands(fh, file_path))
             if todo_commands:
-                return todo_commands
-
-            # Fall back to the default parser
-            return self.parse_content(content, file_path=file_path)
+                result = todo_commands
+            else:
+                # Fall back to the default parser
+                content = _read_text(path, st.st_size)
+                result = self.parse_content(content, file_path=file_path)
         except Exception as e:
             return [
                 {
@@ -426,47 +703,98 @@ class MarkdownParser:
                 }
             ]
 
+        self._parse_cache[cache_key] = copy.deepcopy(result)
+        if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return result
+
+    def parse_files(
+        self,
+        paths: List[str],
+        workers: Optional[int] = None,
+        use_processes: bool = True,
+    ) -> List[List[Dict[str, Any]]]:
+        """Parse many files concurrently.
+
+        Parsing is CPU-bound Python (regex plus string slicing), so the
+        default fans out to worker processes for near-linear scaling across
+        cores. Pass ``use_processes=False`` to use threads instead, which
+        is preferable when reads dominate (e.g. network filesystems).
+
+        Args:
+            paths: Paths of the markdown files to parse
+            workers: Worker count (defaults to the executor's own default)
+            use_processes: Use a process pool rather than a thread pool
+
+        Returns:
+            Per-file result lists, in the same order as ``paths``
+        """
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if not paths:
+            return []
+
+        if use_processes:
+            # Scale chunksize with the batch so IPC overhead stays amortized
+            # without starving workers on short path lists
+            n_workers = workers or os.cpu_count() or 1
+            chunksize = max(1, len(paths) // (n_workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_parse_one, paths, chunksize=chunksize))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.parse_file, paths))
+
     def parse_content(
-        self, content: str, file_path: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        self, content: str, file_path: Optional[str] = None, use_cache: bool = True
+    ) -> List[ParsedBlock]:
         """
         Parse markdown content and extract code blocks and commands.
 
         Args:
             content: Markdown content as string
             file_path: Optional path to the source file
+            use_cache: Reuse cached results for previously seen content
 
         Returns:
-            List of dictionaries containing parsed commands and metadata
+            List of ParsedBlock records (dict-style access supported)
         """
+        if use_cache:
+            digest = hashlib.blake2b(
+                content.encode("utf-8", "surrogatepass"), digest_size=16
+            ).digest()
+            cache_key = (digest, file_path)
+            cached = self._content_cache.get(cache_key)
+            if cached is not None:
+                self._content_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+
         results = []
+        newlines = _newline_offsets(content)
 
-        # Find all code blocks
-        for match in self.code_block_pattern.finditer(content):
-            code_block = match.group(1).strip()
-            if not code_block:
+        # Find all code blocks with a single linear fence scan; blocks carry
+        # spans into `content`, so nothing is copied until a caller reads
+        # .code_block or .commands
+        for fence, body_start, body_end in _iter_fenced_blocks(content):
+            if _span_is_blank(content, body_start, body_end):
                 continue
 
-            # Get line number of the code block
-            start_line = content[: match.start()].count("\n") + 1
-            end_line = start_line + code_block.count("\n")
-
-            # Extract commands from the code block
-            commands = self._extract_commands(code_block)
-
             results.append(
-                {
-                    "file": file_path,
-                    "code_block": code_block,
-                    "start_line": start_line,
-                    "end_line": end_line,
-                    "commands": commands,
-                }
+                ParsedBlock(
+                    file=file_path,
+                    start_line=bisect_right(newlines, fence) + 1,
+                    content=content,
+                    span=(body_start, body_end),
+                )
             )
 
+        if use_cache:
+            self._content_cache[cache_key] = copy.deepcopy(results)
+            if len(self._content_cache) > self.PARSE_CACHE_SIZE:
+                self._content_cache.popitem(last=False)
+
         return results
 
-    def _extract_commands(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_commands(self, text: str) -> List[ParsedCommand]:
         """
         Extract shell commands from text.
 
@@ -474,23 +802,11 @@ class MarkdownParser:
             text: Text to extract commands from
 
         Returns:
-            List of dictionaries with command information
+            List of ParsedCommand records
         """
-        commands = []
-        for match in self.command_pattern.finditer(text):
-            command = match.group(1).strip()
-            if command:
-                line_number = text[: match.start()].count("\n") + 1
-                commands.append(
-                    {
-                        "command": command,
-                        "line_number": line_number,
-                        "original_line": match.group(0).strip(),
-                    }
-                )
-        return commands
+        return _extract_commands(text)
 
-    def parse_commands(self, content: str) -> List[Dict[str, Any]]:
+    def parse_commands(self, content: str) -> List[ParsedCommand]:
         """
         Parse and extract commands from markdown content.
 
@@ -498,11 +814,11 @@ class MarkdownParser:
             content: Markdown content as string
 
         Returns:
-            List of dictionaries with command information
+            List of ParsedCommand records
         """
         commands = []
         for block in self.parse_content(content):
-            commands.extend(block["commands"])
+            commands.extend(block.commands)
         return commands
 
     def find_failed_commands(self, file_path: str) -> List[FailedCommand]:
@@ -536,19 +852,33 @@ class MarkdownParser:
             FileNotFoundError: If the specified file does not exist
         """
         path = Path(file_path)
-        if not path.exists() or not path.is_file():
+        # Single stat() doubles as the existence check and the size probe
+        try:
+            st = path.stat()
+        except OSError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        if not S_ISREG(st.st_mode):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         try:
-            content = path.read_text(encoding="utf-8")
-            sections = content.split("---\n\n## ")
+            content = _read_text(path, st.st_size)
+
+            # Slice sections off separator offsets rather than materializing
+            # every section up front with str.split
+            separators = list(_FAILED_SEP_RE.finditer(content))
 
             commands = []
-            for section in sections[1:]:  # Skip the first section (header)
+            for i, separator in enumerate(separators):
+                next_start = (
+                    separators[i + 1].start()
+                    if i + 1 < len(separators)
+                    else len(content)
+                )
+                section = content[separator.end() : next_start]
                 try:
                     # Parse command details from section
-                    lines = section.split("\n")
-                    title = lines[0].strip("# ").strip()
+                    title_line, _, body = section.partition("\n")
+                    title = title_line.strip("# ").strip()
 
                     # Initialize command data
                     cmd_data = {
@@ -564,77 +894,23 @@ class MarkdownParser:
                         "metadata": {},
                     }
 
-                    # Parse section content
-                    current_key = None
-                    current_value = []
-
-                    for line in lines[1:]:
-                        line = line.strip()
-                        if not line:
-                            continue
-
-                        # Check for key-value pairs
-                        if line.startswith("**"):
-                            # Save previous key-value pair
-                            if current_key and current_value:
-                                value = "\n".join(current_value).strip()
-                                if current_key.lower() == "command":
-                                    cmd_data["command"] = value.strip("`")
-                                elif current_key.lower() == "source":
-                                    cmd_data["source"] = value
-                                elif current_key.lower() == "type":
-                                    cmd_data["command_type"] = value.lower()
-                                elif current_key.lower() == "status":
-                                    cmd_data["status"] = self._clean_status(value)
-                                elif current_key.lower() == "return code":
-                                    try:
-                                        cmd_data["return_code"] = int(value)
-                                    except (ValueError, TypeError):
-                                        cmd_data["return_code"] = 1
-                                elif current_key.lower() == "execution time":
-                                    try:
-                                        cmd_data["execution_time"] = float(
-                                            value.rstrip("s")
-                                        )
-                                    except (ValueError, TypeError):
-                                        pass
-
-                                current_key = None
-                                current_value = []
-
-                            # Start new key-value pair
-                            key_match = re.match(r"\*\*([^:]+):\*\*", line)
-                            if key_match:
-                                current_key = key_match.group(1).strip()
-                                value_part = line[key_match.end() :].strip()
-                                if value_part:
-                                    current_value.append(value_part)
-                        elif current_key is not None:
-                            current_value.append(line)
-                        elif line.startswith("```"):
-                            # Skip code block markers
-                            continue
-                        elif line.startswith("**Metadata:**"):
-                            # Parse metadata section
-                            metadata_text = "\n".join(lines[lines.index(line) + 1 :])
-                            cmd_data["metadata"] = self._parse_metadata(metadata_text)
-                            break
-
-                    # Save the last key-value pair
-                    if current_key and current_value:
-                        value = "\n".join(current_value).strip()
-                        if current_key.lower() == "command":
-                            cmd_data["command"] = value.strip("`")
-                        elif current_key.lower() == "source":
-                            cmd_data["source"] = value
-                        elif current_key.lower() == "type":
-                            cmd_data["command_type"] = value.lower()
+                    # One multiline scan pulls every '**Key:** value' block
+                    # (with continuation lines) out of the section, replacing
+                    # the per-line accumulator state machine
+                    for kv in _KV_BLOCK_RE.finditer(body):
+                        value = "\n".join(
+                            filter(None, map(str.strip, kv.group(2).splitlines()))
+                        )
+                        if value:
+                            self._update_command_data(
+                                cmd_data, kv.group(1).strip(), value
+                            )
 
                     # Add to commands list
                     commands.append(cmd_data)
 
                 except Exception as e:
-                    print(f"Error parsing section: {str(e)}")
+                    logger.warning("Error parsing section: %s", e)
                     continue
 
             return commands
@@ -668,25 +944,107 @@ class MarkdownParser:
             }
 
         total = len(commands)
-        failed = sum(1 for cmd in commands if cmd.get("exit_code", 0) != 0)
-        success_rate = (total - failed) / total if total > 0 else 1.0
-
-        error_codes = {}
-        command_types = {}
 
-        for cmd in commands:
-            # Count error codes
-            error_code = cmd.get("exit_code", 0)
-            error_codes[error_code] = error_codes.get(error_code, 0) + 1
-
-            # Count command types from metadata if available
-            cmd_type = cmd.get("metadata", {}).get("command_type", "unknown")
-            command_types[cmd_type] = command_types.get(cmd_type, 0) + 1
+        # Counter tallies in C; the failure count falls out of the zero bucket
+        error_codes = Counter(cmd.get("exit_code", 0) for cmd in commands)
+        command_types = Counter(
+            cmd.get("metadata", {}).get("command_type", "unknown") for cmd in commands
+        )
+        failed = total - error_codes[0]
+        success_rate = (total - failed) / total if total > 0 else 1.0
 
         return {
             "total_commands": total,
             "failed_commands": failed,
             "success_rate": success_rate,
-            "error_codes": error_codes,
-            "command_types": command_types,
+            "error_codes": dict(error_codes),
+            "command_types": dict(command_types),
         }
+
+
+class IncrementalMarkdownParser:
+    """Incremental variant of :meth:`MarkdownParser.parse_content`.
+
+    For content that grows monotonically (e.g. a command-output log that is
+    re-parsed as it streams in), feeding only the appended chunk re-scans
+    from the last *stable boundary* -- the end of the last closed code
+    fence -- instead of from byte zero. Each update therefore costs
+    O(len(chunk)) plus the tail of any still-open block, not O(total).
+
+    Completed blocks produce the same result dictionaries as
+    ``parse_content``, in document order.
+    """
+
+    def __init__(self, file_path: Optional[str] = None):
+        self.file_path = file_path
+        self._parser = MarkdownParser()
+        self._buffer = ""
+        # Line number (1-based) of the first line in the current buffer;
+        # consumed prefixes are dropped, so this carries the running total
+        self._line = 1
+        self._results: List[ParsedBlock] = []
+
+    def feed(self, chunk: str) -> List[ParsedBlock]:
+        """Consume ``chunk`` and return the blocks it completed.
+
+        Args:
+            chunk: Text appended to the document since the last call
+
+        Returns:
+            Result dictionaries for code blocks closed by this chunk
+        """
+        buf = self._buffer + chunk
+        find = buf.find
+        pos = 0
+        stable = 0
+        emitted = []
+
+        while True:
+            start = find("```", pos)
+            if start == -1:
+                # Keep the last two chars: a fence may be split mid-chunk
+                stable = max(stable, len(buf) - 2)
+                break
+            newline = find("\n", start + 3)
+            if newline == -1:
+                stable = max(stable, start)
+                break
+            info = buf[start + 3 : newline].rstrip()
+            if info and not info.replace("_", "").isalnum():
+                pos = start + 3
+                continue
+            end = find("```", newline + 1)
+            if end == -1:
+                # Open block: resume at its fence once more data arrives
+                stable = max(stable, start)
+                break
+
+            code_block = buf[newline + 1 : end].strip()
+            if code_block:
+                # Materialized eagerly: the internal buffer is trimmed after
+                # every feed, so emitted blocks must not hold spans into it
+                emitted.append(
+                    ParsedBlock(
+                        file=self.file_path,
+                        start_line=self._line + buf.count("\n", 0, start),
+                        code_block=code_block,
+                        commands=_extract_commands(code_block),
+                    )
+                )
+            pos = end + 3
+            stable = pos
+
+        # Drop the consumed prefix so memory stays bounded by the open tail
+        stable = max(stable, 0)
+        self._line += buf.count("\n", 0, stable)
+        self._buffer = buf[stable:]
+        self._results.extend(emitted)
+        return emitted
+
+    def finalize(self) -> List[ParsedBlock]:
+        """Return every block parsed so far.
+
+        An unclosed trailing fence yields nothing, matching what
+        ``parse_content`` produces for the same document.
+        """
+        return list(self._results)
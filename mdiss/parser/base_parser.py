@@ -1,6 +1,7 @@
 """
 Base parser class for markdown parsing.
 """
+import re
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -8,6 +9,34 @@ from typing import Any, Dict, List, Optional
 from .exceptions import ParserError
 from .models import CommandData
 
+# Compiled once at import: per-call re.findall/re.sub with literal patterns
+# pays a cache lookup (hashing the whole pattern string) on every invocation
+_CODE_BLOCK_RE = re.compile(r"```(?:\w*\n)?(.*?)```", re.DOTALL)
+# Trailing whitespace on any line (but not the newline itself): one multiline
+# substitution replaces the per-line rstrip/split/join round trip
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+# Deletion table covering the emoji blocks statuses actually use; C-level
+# str.translate skips the regex engine entirely
+_EMOJI_TRANS = dict.fromkeys(
+    [
+        *range(0x1F600, 0x1F650),
+        *range(0x1F300, 0x1F600),
+        *range(0x1F680, 0x1F700),
+        *range(0x1F1E0, 0x1F200),
+        *range(0x2600, 0x2700),
+        *range(0x2700, 0x27C0),
+    ]
+)
+
+# Canonical emoji-prefixed statuses: one dict hit resolves these without
+# touching the translate table at all
+_STATUS_MAP = {
+    "❌ Failed": "Failed",
+    "✅ Passed": "Passed",
+    "⚠️ Warning": "Warning",
+    "⏱️ Timeout": "Timeout",
+}
+
 
 class BaseMarkdownParser(ABC):
     """Abstract base class for markdown parsers."""
@@ -50,20 +79,19 @@ class BaseMarkdownParser(ABC):
         if not path.exists() or not path.is_file():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        content = path.read_text(encoding="utf-8")
-
-        # Extract code blocks using a simple regex
-        import re
+        # read_bytes skips the BufferedReader layer read_text sets up for a
+        # single whole-file read
+        content = path.read_bytes().decode("utf-8")
+        path_str = str(path.absolute())
 
-        code_blocks = re.findall(r"```(?:\w*\n)?(.*?)```", content, re.DOTALL)
-
-        # Clean up the code blocks
+        # Extract and clean code blocks in one pass: finditer streams the
+        # matches and the trailing-whitespace trim is a single C-level
+        # substitution per block instead of a split/rstrip/join loop
         blocks = []
-        for block in code_blocks:
-            # Remove leading/trailing whitespace and empty lines
-            cleaned = "\n".join(line.rstrip() for line in block.strip().split("\n"))
+        for match in _CODE_BLOCK_RE.finditer(content):
+            cleaned = _TRAILING_WS_RE.sub("", match.group(1).strip())
             if cleaned:  # Only include non-empty blocks
-                blocks.append({"code_block": cleaned, "file": str(path.absolute())})
+                blocks.append({"code_block": cleaned, "file": path_str})
 
         return blocks
 
@@ -79,22 +107,10 @@ class BaseMarkdownParser(ABC):
         if not status:
             return ""
 
-        # Remove emojis and extra whitespace
-        import re
-
-        status = re.sub(
-            r"[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\u2600-\u26FF\u2700-\u27BF]",
-            "",
-            status,
-        )
-        status = status.strip()
-
-        # Normalize common status values
-        status_map = {
-            "❌ Failed": "Failed",
-            "✅ Passed": "Passed",
-            "⚠️ Warning": "Warning",
-            "⏱️ Timeout": "Timeout",
-        }
-
-        return status_map.get(status, status)
+        # Canonical statuses resolve with a single hash lookup
+        hit = _STATUS_MAP.get(status.strip())
+        if hit is not None:
+            return hit
+
+        # Fall back to stripping emoji codepoints and extra whitespace
+        return status.translate(_EMOJI_TRANS).strip()
@@ -28,11 +28,15 @@ class FormatHandlerFactory:
             CodeBlockHandler,  # Handles simple code blocks
             # Add more handlers here as they are implemented
         ]
+        # Handlers are stateless between parses, so one instance per class
+        # is built up front instead of on every get_handler call
+        self._handler_instances: List[FormatHandler] = [
+            cls() for cls in self._handlers
+        ]
 
     def get_handler(self, content: str) -> Optional[FormatHandler]:
         """Get the appropriate handler for the given content."""
-        for handler_cls in self._handlers:
-            handler = handler_cls()
+        for handler in self._handler_instances:
             if handler.can_handle(content):
                 return handler
         return None
@@ -41,6 +45,7 @@ class FormatHandlerFactory:
         """Register a new handler."""
         if handler_cls not in self._handlers:
             self._handlers.insert(0, handler_cls)  # Insert at beginning to check first
+            self._handler_instances.insert(0, handler_cls())
 
 
 # Initialize the default factory
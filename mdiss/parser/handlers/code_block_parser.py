@@ -14,8 +14,10 @@ class CodeBlockHandler(FormatHandler):
 
     def __init__(self):
         """Initialize the code block handler."""
+        # The language is captured here so the loop does not need a second
+        # regex pass over the matched text
         self.code_block_pattern: Pattern = re.compile(
-            r"```(?:\w+)?\s*\n(.*?)```", re.DOTALL | re.MULTILINE
+            r"```(?P<lang>\w+)?\s*\n(?P<body>.*?)```", re.DOTALL | re.MULTILINE
         )
 
     def can_handle(self, content: str) -> bool:
@@ -35,18 +37,22 @@ class CodeBlockHandler(FormatHandler):
             List of CommandData objects
         """
         commands: List[CommandData] = []
+        source = file_path or ""
 
         for match in self.code_block_pattern.finditer(content):
-            code_block = match.group(1).strip()
+            code_block = match.group("body").strip()
             if not code_block:
                 continue
 
+            # The language group doubles as the command type
+            language = match.group("lang")
+
             # Create a command for each code block
             command = CommandData(
                 title="Command from code block",
                 command=code_block,
-                source=file_path or "",
-                command_type="shell",
+                source=source,
+                command_type=language.lower() if language else "shell",
                 status="Unknown",
                 return_code=0,
                 execution_time=0.0,
@@ -56,11 +62,6 @@ class CodeBlockHandler(FormatHandler):
                 sections={},
             )
 
-            # Try to detect command type from code block language
-            language_match = re.match(r"^```(\w+)", match.group(0))
-            if language_match:
-                command.command_type = language_match.group(1).lower()
-
             commands.append(command)
 
         return commands
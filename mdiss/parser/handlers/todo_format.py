@@ -2,33 +2,77 @@
 Handler for TODO.md format parsing.
 """
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Match, Optional, Pattern, Tuple
 
 from ..exceptions import InvalidCommandError, ParserError
 from ..models import CodeBlock, CommandData, ErrorOutput
 from .base_handler import FormatHandler
 
+# Trailing whitespace on any line (not the newline): one multiline sub at
+# code-block flush time replaces an rstrip copy per buffered line
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+
+# Horizontal-rule separators (---) with either line-ending style
+_SECTION_SPLIT_RE = re.compile(r"\r?\n-{3,}\r?\n")
+
+# Numbered section header ("## 1. title") marking the TODO.md format
+_TODO_DETECT = re.compile(r"^##\s+\d+\.\s+", re.MULTILINE)
+
+
+@lru_cache(maxsize=512)
+def _classify_section_name(section_name: str) -> Optional[str]:
+    """Map a raw header name to its canonical section name.
+
+    Section headers repeat across files (Command, Output, Error Output,
+    Metadata, ...), so after the first encounter the substring cascade
+    collapses to a cache lookup. A module-level function keeps ``self``
+    out of the cache key.
+    """
+    section_name = section_name.lower().strip()
+
+    # Map to standard section names
+    if "command" in section_name:
+        return "command"
+    elif "output" in section_name and "error" not in section_name:
+        return "output"
+    elif any(x in section_name for x in ["error", "stderr"]):
+        return "error_output"
+    elif "suggested" in section_name and "solution" in section_name:
+        return "suggested_solution"
+    elif "metadata" in section_name:
+        return "metadata"
+
+    return section_name
+
 
 class TodoFormatHandler(FormatHandler):
     """Handler for parsing TODO.md format markdown files."""
 
     def can_handle(self, content: str) -> bool:
         """Check if this handler can handle the given content."""
-        # Check for the typical TODO.md format with numbered sections
-        return bool(re.search(r"^##\s+\d+\.\s+", content, re.MULTILINE))
-
-    """Handler for parsing TODO.md format markdown files."""
+        # C-level substring probe rules out most non-TODO content before
+        # the regex scans for numbered sections
+        if "##" not in content:
+            return False
+        return _TODO_DETECT.search(content) is not None
 
     def __init__(self):
         """Initialize the TODO format handler."""
-        self.section_header_pattern: Pattern = re.compile(
-            r"^###?\s*\*\*(.+?)\*\*:?\s*$|^###?\s*([^:]+):?\s*$",
-            re.IGNORECASE | re.MULTILINE,
-        )
         self.metadata_pattern: Pattern = re.compile(
             r"^\s*[\*\-]?\s*\*\*(.+?):\*\*\s*(.+?)\s*$", re.IGNORECASE
         )
-        self.code_block_delimiters = ("```", "~~~")
+        # Every line classified by one alternation: a single finditer pass
+        # replaces the per-line fence check plus header .match call. The
+        # classes stay [ \t]-based so no branch can swallow a newline; the
+        # optional \r before $ keeps fences and headers matching in CRLF
+        # files, where MULTILINE $ asserts before the \n but after the \r.
+        self.line_pattern: Pattern = re.compile(
+            r"(?P<fence>^[ \t]*(?:```|~~~)[ \t]*\r?$)"
+            r"|(?P<hdr>^###?[ \t]*(?:\*\*(?P<h1>.+?)\*\*:?|(?P<h2>[^:\n\r]+?):?)[ \t]*\r?$)"
+            r"|(?P<plain>^.*$)",
+            re.IGNORECASE | re.MULTILINE,
+        )
 
     def parse(self, content: str, file_path: Optional[str] = None) -> List[CommandData]:
         """Parse TODO.md format content.
@@ -41,35 +85,35 @@ class TodoFormatHandler(FormatHandler):
             List of CommandData objects
         """
         commands: List[CommandData] = []
-        sections = self._split_into_sections(content)
-
-        for section in sections:
-            if not section.strip():
-                continue
 
+        for section in self._split_into_sections(content):
             command = self._parse_section(section, file_path)
             if command and command.command:
                 commands.append(command)
 
         return commands
 
-    def _split_into_sections(self, content: str) -> List[str]:
-        """Split content into sections separated by horizontal rules (---)."""
-        # Handle both Windows and Unix line endings
-        return [s.strip() for s in re.split(r"\r?\n-{3,}\r?\n", content)]
+    def _split_into_sections(self, content: str):
+        """Yield stripped, non-empty sections separated by horizontal rules.
+
+        A generator keeps one section alive at a time instead of
+        materializing a stripped copy of every section up front.
+        """
+        for section in _SECTION_SPLIT_RE.split(content):
+            section = section.strip()
+            if section:
+                yield section
 
     def _parse_section(
         self, section: str, file_path: Optional[str] = None
     ) -> CommandData:
         """Parse a single section into a CommandData object."""
-        lines = section.split("\n")
-        if not lines:
-            raise InvalidCommandError("Empty section")
+        title_line, _, body = section.partition("\n")
 
         # Parse title from the first line
-        title_match = re.match(r"^##\s+\d+\.\s+(.+?)(?:\s*\*\*)?$", lines[0].strip())
+        title_match = re.match(r"^##\s+\d+\.\s+(.+?)(?:\s*\*\*)?$", title_line.strip())
         if not title_match:
-            raise InvalidCommandError(f"Invalid section title: {lines[0]}")
+            raise InvalidCommandError(f"Invalid section title: {title_line}")
 
         title = title_match.group(1).strip()
         command = CommandData(
@@ -90,28 +134,29 @@ class TodoFormatHandler(FormatHandler):
         in_code_block = False
         code_block_content = []
 
-        # Process remaining lines
-        for line in lines[1:]:
-            line = line.rstrip()
-
+        # One finditer pass over the section body classifies every line;
+        # dispatch tests the named alternatives instead of several .match
+        # calls per line
+        for match in self.line_pattern.finditer(body):
             # Handle code blocks
-            if line.strip() in self.code_block_delimiters:
+            if match.group("fence") is not None:
                 in_code_block = not in_code_block
                 if not in_code_block and code_block_content and current_section:
-                    self._process_code_block(
-                        "\n".join(code_block_content), current_section, command
-                    )
+                    self._flush_code_block(code_block_content, current_section, command)
                     code_block_content = []
                 continue
 
+            # Buffer code lines untouched; trailing whitespace comes off in
+            # one pass when the block is flushed
             if in_code_block:
-                code_block_content.append(line)
+                code_block_content.append(match.group(0))
                 continue
 
-            # Check for section headers
-            section_match = self.section_header_pattern.match(line)
-            if section_match:
-                current_section = self._parse_section_header(section_match)
+            line = match.group(0).rstrip()
+
+            # Section headers switch the active section
+            if match.group("hdr") is not None:
+                current_section = self._parse_section_header(match)
                 continue
 
             # Skip empty lines outside of sections
@@ -123,34 +168,25 @@ class TodoFormatHandler(FormatHandler):
 
         # Process any remaining code block content
         if in_code_block and code_block_content and current_section:
-            self._process_code_block(
-                "\n".join(code_block_content), current_section, command
-            )
+            self._flush_code_block(code_block_content, current_section, command)
 
         return command
 
+    def _flush_code_block(
+        self, buffered_lines: List[str], section: str, command: CommandData
+    ) -> None:
+        """Join buffered code lines and hand the block to the processor."""
+        self._process_code_block(
+            _TRAILING_WS_RE.sub("", "\n".join(buffered_lines)), section, command
+        )
+
     def _parse_section_header(self, match: Match) -> Optional[str]:
         """Parse a section header and return the normalized section name."""
-        # Try to get the first group (for **bold** headers) or second group (for plain text)
-        section_name = match.group(1) or match.group(2)
+        # Bold headers capture as h1, plain-text headers as h2
+        section_name = match.group("h1") or match.group("h2")
         if not section_name:
             return None
-
-        section_name = section_name.lower().strip()
-
-        # Map to standard section names
-        if "command" in section_name:
-            return "command"
-        elif "output" in section_name and "error" not in section_name:
-            return "output"
-        elif any(x in section_name for x in ["error", "stderr"]):
-            return "error_output"
-        elif "suggested" in section_name and "solution" in section_name:
-            return "suggested_solution"
-        elif "metadata" in section_name:
-            return "metadata"
-
-        return section_name
+        return _classify_section_name(section_name)
 
     def _process_line(self, line: str, section: str, command: CommandData) -> None:
         """Process a line of content based on the current section."""
@@ -162,7 +198,7 @@ class TodoFormatHandler(FormatHandler):
             command.output = line
         elif section == "error_output":
             if command.error_output:
-                command.error_output.content += "\n" + line
+                command.error_output.append(line)
             else:
                 command.error_output = ErrorOutput(content=line)
         elif section == "suggested_solution":
@@ -211,7 +247,7 @@ class TodoFormatHandler(FormatHandler):
 
         if section == "error_output":
             if command.error_output:
-                command.error_output.content += "\n" + content
+                command.error_output.append(content)
             else:
                 command.error_output = ErrorOutput(
                     content=content, is_from_code_block=True
@@ -5,14 +5,30 @@ This module provides the MarkdownParser class which handles parsing of markdown
 to extract commands, code blocks, and metadata in a structured format.
 """
 
+import copy
+import hashlib
 import re
+from collections import OrderedDict
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from .base_parser import _STATUS_MAP
 from .exceptions import ParserError
 from .models import CommandData, ErrorOutput, Metadata, Section
 from .parsers import MarkdownParser as NewMarkdownParser
 
+# Compiled once at import so _clean_status does not pay the re cache lookup
+# on every status string
+_STATUS_CLEAN_RE = re.compile(r"[^\w\s]")
+
+# Upper bound on cached parse_content results per parser instance
+_PARSE_CACHE_SIZE = 128
+
+# Pre-bound accessor: one C-level call per code block instead of two
+# attribute lookups in the serialization hot loop
+_CB_FIELDS = attrgetter("content", "language")
+
 
 class MarkdownParser(NewMarkdownParser):
     """
@@ -28,6 +44,11 @@ class MarkdownParser(NewMarkdownParser):
         self.metadata_pattern = re.compile(r"- \*\*(.*?):\*\*\s*(.*)")
         self.file_path: Optional[str] = None
         self.commands: List[CommandData] = []
+        # Bound once so parse() skips the super() proxy and MRO walk per call
+        self._super_parse = super().parse
+        # Content-hash cache: repeated parses of identical markdown return
+        # the stored result instead of re-running the parser
+        self._parse_cache: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
 
     def parse(self, content: str, file_path: Optional[str] = None) -> List[CommandData]:
         """Parse markdown content and extract commands.
@@ -42,7 +63,7 @@ class MarkdownParser(NewMarkdownParser):
             List of CommandData objects
         """
         self.file_path = file_path or ""
-        self.commands = super().parse(content, self.file_path)
+        self.commands = self._super_parse(content, self.file_path)
         return self.commands
 
     def parse_content(self, content: str) -> List[Dict[str, Any]]:
@@ -56,8 +77,23 @@ class MarkdownParser(NewMarkdownParser):
         Returns:
             List of command dictionaries
         """
+        # blake2b is the fastest stdlib hash; 16 bytes is plenty for a
+        # per-instance cache key
+        key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            # Deep copies keep callers from mutating the cached entry
+            return copy.deepcopy(cached)
+
         self.parse(content)
-        return [self._command_to_dict(cmd) for cmd in self.commands]
+        _to_dict = self._command_to_dict
+        result = [_to_dict(cmd) for cmd in self.commands]
+
+        self._parse_cache[key] = copy.deepcopy(result)
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return result
 
     def _parse_metadata_text(self, text: str) -> Dict[str, str]:
         """Parse metadata text into a dictionary.
@@ -87,8 +123,13 @@ class MarkdownParser(NewMarkdownParser):
         Returns:
             Cleaned status string
         """
+        # Canonical emoji-prefixed statuses resolve with one dict lookup
+        hit = _STATUS_MAP.get(status.strip())
+        if hit is not None:
+            return hit
+
         # Remove emoji and extra whitespace
-        return re.sub(r"[^\w\s]", "", status).strip()
+        return _STATUS_CLEAN_RE.sub("", status).strip()
 
     def parse_file(self, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
         """Parse a markdown file and return list of command dictionaries.
@@ -106,39 +147,11 @@ class MarkdownParser(NewMarkdownParser):
         if not path.exists() or not path.is_file():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        content = path.read_text(encoding="utf-8")
+        # read_bytes skips the BufferedReader layer read_text sets up for a
+        # single whole-file read
+        content = path.read_bytes().decode("utf-8")
         return self.parse_content(content)
 
-    def _clean_status(self, status: str) -> str:
-        """Remove emoji and extra whitespace from status.
-
-        Args:
-            status: Status string to clean
-
-        Returns:
-            Cleaned status string
-        """
-        # Remove emoji and extra whitespace
-        return re.sub(r"[^\w\s]", "", status).strip()
-
-    def _parse_metadata_text(self, text: str) -> Dict[str, str]:
-        """Parse metadata text into a dictionary.
-
-        Args:
-            text: Metadata text to parse
-
-        Returns:
-            Dictionary of metadata key-value pairs
-        """
-        metadata = {}
-        for line in text.strip().split("\n"):
-            match = self.metadata_pattern.match(line.strip())
-            if match:
-                key = match.group(1).strip()
-                value = match.group(2).strip()
-                metadata[key] = value
-        return metadata
-
     def _command_to_dict(self, command: CommandData) -> Dict[str, Any]:
         """Convert a CommandData object to a dictionary.
 
@@ -160,8 +173,8 @@ class MarkdownParser(NewMarkdownParser):
                     "name": section.name,
                     "content": section.content,
                     "code_blocks": [
-                        {"content": cb.content, "language": cb.language}
-                        for cb in section.code_blocks
+                        {"content": content, "language": language}
+                        for content, language in map(_CB_FIELDS, section.code_blocks)
                     ],
                 }
                 for section in command.sections
@@ -25,12 +25,52 @@ class Section:
     code_blocks: List[CodeBlock] = field(default_factory=list)
 
 
-@dataclass
 class ErrorOutput:
-    """Represents error output from a command."""
-
-    content: str
-    is_from_code_block: bool = False
+    """Represents error output from a command.
+
+    Appended chunks accumulate in a list and ``content`` is joined lazily,
+    so building a long error output line by line stays O(N) instead of the
+    quadratic cost of repeated string concatenation.
+    """
+
+    __slots__ = ("_chunks", "_content", "is_from_code_block")
+
+    def __init__(self, content: str = "", is_from_code_block: bool = False):
+        # Seeded even when empty so appending matches the historical
+        # 'content += "\n" + chunk' result (leading newline included)
+        self._chunks: List[str] = [content]
+        self._content: Optional[str] = content
+        self.is_from_code_block = is_from_code_block
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = "\n".join(self._chunks)
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._chunks = [value]
+        self._content = value
+
+    def append(self, chunk: str) -> None:
+        """Add a chunk on its own line without copying existing content."""
+        self._chunks.append(chunk)
+        self._content = None
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ErrorOutput):
+            return NotImplemented
+        return (
+            self.content == other.content
+            and self.is_from_code_block == other.is_from_code_block
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ErrorOutput(content={self.content!r}, "
+            f"is_from_code_block={self.is_from_code_block!r})"
+        )
 
 
 @dataclass
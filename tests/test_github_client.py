@@ -413,6 +413,132 @@ class TestGitHubClient:
             assert len(dry_run_prints) == 2  # Po jednym dla każdego polecenia
 
 
+class TestGitHubClientEtagCache:
+    """Tests for the conditional-GET ETag cache."""
+
+    REPO_URL = "https://api.github.com/repos/test_owner/test_repo"
+
+    def setup_method(self):
+        """Setup przed każdym testem."""
+        self.config = GitHubConfig(
+            token="test_token", owner="test_owner", repo="test_repo"
+        )
+        self.client = GitHubClient(self.config)
+
+    @responses.activate
+    def test_304_served_from_cache(self):
+        """A 304 response is answered from the cached body."""
+        responses.add(
+            responses.GET,
+            self.REPO_URL,
+            json={"name": "test_repo", "topics": ["a"]},
+            status=200,
+            headers={"ETag": 'W/"abc"'},
+        )
+        responses.add(responses.GET, self.REPO_URL, status=304)
+
+        first = self.client.get_repository_info()
+        second = self.client.get_repository_info()
+
+        assert second == first
+        # The revalidation request carried the stored ETag
+        assert responses.calls[1].request.headers["If-None-Match"] == 'W/"abc"'
+
+    @responses.activate
+    def test_cached_body_isolated_from_caller_mutation(self):
+        """Mutating a returned body must not poison later cache hits."""
+        responses.add(
+            responses.GET,
+            self.REPO_URL,
+            json={"name": "test_repo", "topics": ["a"]},
+            status=200,
+            headers={"ETag": 'W/"abc"'},
+        )
+        responses.add(responses.GET, self.REPO_URL, status=304)
+        responses.add(responses.GET, self.REPO_URL, status=304)
+
+        first = self.client.get_repository_info()
+        first["topics"].append("mutated")
+
+        second = self.client.get_repository_info()
+        assert second["topics"] == ["a"]
+
+        # A hit hands out its own copy as well
+        second["name"] = "renamed"
+        third = self.client.get_repository_info()
+        assert third["name"] == "test_repo"
+
+
+class TestGitHubClientBulkCreate:
+    """Tests for the thread-pooled bulk_create_issues path."""
+
+    def setup_method(self):
+        """Setup przed każdym testem."""
+        self.config = GitHubConfig(
+            token="test_token", owner="test_owner", repo="test_repo"
+        )
+        self.client = GitHubClient(self.config)
+        self.commands = [
+            FailedCommand(
+                title=f"Test {i}",
+                command=f"test{i}",
+                source="/test",
+                command_type="test",
+                status="Failed",
+                return_code=1,
+                execution_time=1.0,
+                output="",
+                error_output="error",
+                metadata={},
+            )
+            for i in range(4)
+        ]
+
+    def test_bulk_create_results_keep_input_order(self):
+        """Results come back in input order even when POSTs finish out of order."""
+        import time
+
+        def fake_create(owner=None, repo=None, issue=None, **kwargs):
+            index = int(issue["title"].rsplit(" ", 1)[-1])
+            # Earlier commands finish last, exercising the ordering guarantee
+            time.sleep((len(self.commands) - index) * 0.01)
+            return {"number": index, "title": issue["title"]}
+
+        with patch.object(
+            self.client, "create_issue", side_effect=fake_create
+        ), patch.object(self.client, "ensure_labels") as mock_ensure:
+            result = self.client.bulk_create_issues(self.commands)
+
+        assert [issue["number"] for issue in result] == [0, 1, 2, 3]
+        assert [issue["title"] for issue in result] == [
+            f"Fix: Test {i}" for i in range(4)
+        ]
+
+        # The label union is pre-created in a single call
+        mock_ensure.assert_called_once()
+        ensured = mock_ensure.call_args[0][0]
+        assert "bug" in ensured and "automated" in ensured
+
+    def test_bulk_create_continues_past_failures(self):
+        """One failing POST must not drop the remaining issues."""
+
+        def fake_create(owner=None, repo=None, issue=None, **kwargs):
+            if issue["title"] == "Fix: Test 1":
+                raise Exception("boom")
+            return {"title": issue["title"]}
+
+        with patch.object(
+            self.client, "create_issue", side_effect=fake_create
+        ), patch.object(self.client, "ensure_labels"):
+            result = self.client.bulk_create_issues(self.commands)
+
+        assert [issue["title"] for issue in result] == [
+            "Fix: Test 0",
+            "Fix: Test 2",
+            "Fix: Test 3",
+        ]
+
+
 @pytest.fixture
 def sample_failed_command():
     """Przykładowe nieudane polecenie do testów."""
@@ -0,0 +1,94 @@
+"""
+Tests for the TTL caches in the GitHub integration.
+
+The PyGithub client is replaced with a mock so the cache behaviour can be
+exercised without the optional dependency or the network.
+"""
+from unittest.mock import MagicMock, patch
+
+from mdiss.integrations.github_integration import GitHubIntegration
+
+
+def _make_integration():
+    """Build an integration with a mocked PyGithub client."""
+    with patch.object(GitHubIntegration, "_get_client", return_value=MagicMock()):
+        return GitHubIntegration(token="test_token")
+
+
+class TestRepoCache:
+    """Tests for the repository object TTL cache."""
+
+    def test_repo_reused_within_ttl(self):
+        """A second lookup inside the TTL window skips get_repo."""
+        integration = _make_integration()
+
+        first = integration._get_repo_cached("owner/repo")
+        second = integration._get_repo_cached("owner/repo")
+
+        assert second is first
+        integration.client.get_repo.assert_called_once_with("owner/repo")
+
+    def test_repo_refetched_after_expiry(self):
+        """An expired entry goes back to the API."""
+        integration = _make_integration()
+
+        integration._get_repo_cached("owner/repo", ttl=0.0)
+        integration._get_repo_cached("owner/repo")
+
+        assert integration.client.get_repo.call_count == 2
+
+
+class TestIssuesCache:
+    """Tests for the list_issues TTL cache."""
+
+    def test_listing_reused_within_ttl(self):
+        """Identical queries inside the TTL hit the cache."""
+        integration = _make_integration()
+        issues = [{"number": 1, "title": "Issue 1"}]
+
+        with patch.object(
+            integration, "iter_issues", return_value=iter(issues)
+        ) as mock_iter:
+            first = integration.list_issues("owner/repo")
+            second = integration.list_issues("owner/repo")
+
+        assert first == issues
+        assert second == issues
+        mock_iter.assert_called_once()
+
+    def test_returned_list_isolated_from_cache(self):
+        """Mutating a returned listing must not leak into later hits."""
+        integration = _make_integration()
+        issues = [{"number": 1, "title": "Issue 1"}]
+
+        with patch.object(integration, "iter_issues", return_value=iter(issues)):
+            first = integration.list_issues("owner/repo")
+            first.append({"number": 99, "title": "Injected"})
+            second = integration.list_issues("owner/repo")
+
+        assert [issue["number"] for issue in second] == [1]
+
+    def test_different_filters_cached_separately(self):
+        """The cache key covers state and extra filters."""
+        integration = _make_integration()
+
+        with patch.object(
+            integration, "iter_issues", side_effect=lambda *a, **kw: iter([])
+        ) as mock_iter:
+            integration.list_issues("owner/repo", state="open")
+            integration.list_issues("owner/repo", state="closed")
+
+        assert mock_iter.call_count == 2
+
+    def test_create_issue_invalidates_repo_listings(self):
+        """Creating an issue drops cached listings for that repo."""
+        integration = _make_integration()
+
+        with patch.object(integration, "iter_issues", return_value=iter([])):
+            integration.list_issues("owner/repo")
+        assert integration._issues_cache
+
+        with patch.object(integration, "_issue_to_dict", return_value={}):
+            integration.create_issue("owner/repo", "title", "body")
+
+        assert not integration._issues_cache
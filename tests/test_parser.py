@@ -359,3 +359,34 @@ def test_parse_file_integration(sample_markdown_file):
     error_block = blocks[1]
     assert "poetry.lock error" in error_block["code_block"]
     assert error_block["file"] == str(sample_markdown_file)
+
+
+def test_todo_handler_parses_crlf_like_lf():
+    """CRLF input must yield the same commands as LF input."""
+    from mdiss.parser.handlers import TodoFormatHandler
+
+    content = (
+        "## 1. Install deps\n"
+        "\n"
+        "### Command\n"
+        "```\n"
+        "make install\n"
+        "```\n"
+        "\n"
+        "### Error Output\n"
+        "```\n"
+        "poetry.lock error\n"
+        "```\n"
+        "\n"
+        "### Metadata\n"
+        "- **target:** install\n"
+    )
+
+    handler = TodoFormatHandler()
+    lf_commands = handler.parse(content)
+    crlf_commands = handler.parse(content.replace("\n", "\r\n"))
+
+    assert len(lf_commands) == len(crlf_commands) == 1
+    assert crlf_commands[0].command == lf_commands[0].command == "make install"
+    assert crlf_commands[0].error_output.content == "poetry.lock error"
+    assert crlf_commands[0].metadata == {"target": "install"}
@@ -0,0 +1,91 @@
+"""
+Tests for the shared rate limiter in the integrations HTTP layer.
+"""
+import time
+
+from mdiss.integrations._http import RateLimiter
+
+
+class _FakeResponse:
+    """Minimal response stand-in carrying only headers."""
+
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class TestRateLimiter:
+    """Tests for the header-driven token bucket."""
+
+    def test_acquire_without_server_data_is_immediate(self):
+        """Before any headers arrive the bucket stays at burst capacity."""
+        limiter = RateLimiter(burst=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+    def test_update_derives_rate_from_headers(self):
+        """Remaining/reset headers set a positive refill rate."""
+        limiter = RateLimiter(burst=3)
+        limiter.update(
+            _FakeResponse(
+                {
+                    "X-RateLimit-Remaining": "100",
+                    "X-RateLimit-Reset": str(int(time.time()) + 10),
+                }
+            )
+        )
+
+        assert limiter._rate is not None
+        assert limiter._rate > 0
+
+    def test_update_reads_gitlab_headers(self):
+        """The GitLab header pair is understood as well."""
+        limiter = RateLimiter(burst=3)
+        limiter.update(
+            _FakeResponse(
+                {
+                    "RateLimit-Remaining": "50",
+                    "RateLimit-Reset": str(int(time.time()) + 10),
+                }
+            )
+        )
+
+        assert limiter._rate is not None
+        assert limiter._rate > 0
+
+    def test_exhausted_quota_blocks_until_reset(self):
+        """Remaining=0 drains the bucket and holds acquirers to the reset."""
+        limiter = RateLimiter(burst=3)
+        limiter.update(
+            _FakeResponse(
+                {
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(int(time.time()) + 2),
+                }
+            )
+        )
+
+        assert limiter._tokens == 0.0
+
+        start = time.monotonic()
+        limiter.acquire()
+        # The acquire must have slept out the reset window (at least one
+        # full second regardless of sub-second truncation) rather than
+        # refilling to burst immediately
+        assert time.monotonic() - start >= 1.0
+
+    def test_bad_header_values_are_ignored(self):
+        """Unparseable header values leave the limiter state untouched."""
+        limiter = RateLimiter(burst=3)
+        limiter.update(
+            _FakeResponse(
+                {"X-RateLimit-Remaining": "lots", "X-RateLimit-Reset": "soon"}
+            )
+        )
+
+        assert limiter._rate is None
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start < 0.05
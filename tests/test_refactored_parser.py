@@ -8,7 +8,7 @@ import pytest
 
 from mdiss.parser import MarkdownParser
 from mdiss.parser.handlers import CodeBlockHandler, TodoFormatHandler
-from mdiss.parser.models import CommandData
+from mdiss.parser.models import CommandData, ErrorOutput
 
 
 class TestRefactoredParser:
@@ -181,3 +181,42 @@ print("World")
         assert commands[0].command_type == "bash"
         assert commands[1].command == 'print("World")'
         assert commands[1].command_type == "python"
+
+
+class TestErrorOutput:
+    """Tests for the chunked ErrorOutput model."""
+
+    def test_content_round_trip(self):
+        """Construction and the content property agree."""
+        error = ErrorOutput(content="boom", is_from_code_block=True)
+        assert error.content == "boom"
+        assert error.is_from_code_block is True
+
+    def test_append_joins_with_newlines(self):
+        """Appended chunks land on their own lines."""
+        error = ErrorOutput(content="line 1")
+        error.append("line 2")
+        error.append("line 3")
+        assert error.content == "line 1\nline 2\nline 3"
+
+    def test_append_to_empty_keeps_leading_newline(self):
+        """Appending to an empty output matches the old += behaviour."""
+        error = ErrorOutput()
+        error.append("late line")
+        assert error.content == "\nlate line"
+
+    def test_content_setter_resets_chunks(self):
+        """Assigning content discards previously appended chunks."""
+        error = ErrorOutput(content="old")
+        error.append("more")
+        error.content = "fresh"
+        assert error.content == "fresh"
+        error.append("tail")
+        assert error.content == "fresh\ntail"
+
+    def test_equality_compares_content_and_origin(self):
+        """Equality looks at the joined content and the code-block flag."""
+        built = ErrorOutput(content="a")
+        built.append("b")
+        assert built == ErrorOutput(content="a\nb")
+        assert built != ErrorOutput(content="a\nb", is_from_code_block=True)